@@ -2,11 +2,33 @@
 """
 Batch Create/Update Claude Office Skills
 Based on architecture diagram: Skills = Domain Knowledge + Templates + Scripts
+
+Usage:
+    python3 batch_create_skills.py [--specs FILE] [--jobs N] [--batch-size N]
+                                   [--skills-dir PATH] [--profile [TRACE_FILE]]
+
+Specs have the same shape as the SKILLS_TO_CREATE entries, one per JSONL line
+or YAML document.
 """
 
+import argparse
+import json
 import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import yaml
+except ImportError:  # only needed for YAML spec files
+    yaml = None
+
+import skill_profiler
 
 # Base directory
 BASE_DIR = Path(__file__).parent.parent
@@ -870,48 +892,260 @@ pip install python-docx openpyxl python-pptx reportlab jinja2
     
     return content
 
-def main():
+# ═══════════════════════════════════════════════════════════════════════════════
+# SPEC STREAMING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Keys create_skill_md() reads from a spec
+REQUIRED_SPEC_FIELDS = ('name', 'description', 'tags', 'library', 'overview',
+                        'use_cases', 'core_concepts', 'best_practices')
+
+# A skill name becomes a directory under the skills root: one path
+# component, no separators, no leading dot (so no '..' either)
+SKILL_NAME_PATTERN = re.compile(r'[A-Za-z0-9][A-Za-z0-9._-]*')
+
+# Specs handed to the worker pool at a time; bounds memory for any input size
+DEFAULT_BATCH_SIZE = 256
+
+# Statuses returned by create_skill() and counted by create_skills()
+CREATED = 'created'
+SKIPPED = 'skipped'
+DUPLICATE = 'duplicate'
+INVALID = 'invalid'
+FAILED = 'failed'
+
+
+def iter_specs(spec_path: Optional[Path]) -> Iterator[dict]:
+    """Yield skill specs one at a time.
+
+    `spec_path` is a JSONL file (one spec per line) or a YAML stream (one
+    spec, or a list of specs, per `---` document); '-' reads JSONL from
+    stdin. Without a path the built-in SKILLS_TO_CREATE specs are used.
+    """
+    if spec_path is None:
+        yield from SKILLS_TO_CREATE.values()
+        return
+    
+    if str(spec_path) == '-':
+        yield from _iter_jsonl(sys.stdin)
+        return
+    
+    with open(spec_path, encoding='utf-8') as f:
+        if spec_path.suffix in ('.yaml', '.yml'):
+            if yaml is None:
+                raise SystemExit("❌ YAML specs require PyYAML: pip install pyyaml")
+            for document in yaml.safe_load_all(f):
+                if isinstance(document, list):
+                    yield from document
+                elif document is not None:
+                    yield document
+        else:
+            yield from _iter_jsonl(f)
+
+
+def _iter_jsonl(lines: Iterable[str]) -> Iterator[dict]:
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            print(f"⚠️  Line {line_number}: invalid JSON ({e})")
+
+
+def validate_spec(config) -> Optional[str]:
+    """Return why `config` cannot be turned into a skill, or None if it can."""
+    if not isinstance(config, dict):
+        return f"not a mapping: {repr(config)[:60]}"
+    name = config.get('name')
+    if not isinstance(name, str) or not SKILL_NAME_PATTERN.fullmatch(name):
+        return f"unsafe or missing name {name!r} (letters, digits, '.', '_' and '-' only)"
+    missing = [k for k in REQUIRED_SPEC_FIELDS if k not in config]
+    if missing:
+        return f"{name}: missing {', '.join(missing)}"
+    return None
+
+
+def scan_skill_dirs(base_dir: Path) -> Set[str]:
+    """Names of the existing directories in `base_dir`, from a single scandir()."""
+    with os.scandir(base_dir) as entries:
+        return {entry.name for entry in entries if entry.is_dir()}
+
+
+def create_skill(base_dir: Path, config: dict, exists: bool) -> Tuple[str, str, str]:
+    """Render and write one skill. Returns (skill_name, status, message).
+
+    `exists` says whether the skill directory is already there; only then is
+    SKILL.md itself checked, so new skills cost no extra stat. The spec is
+    validated before anything touches the disk, and an error while rendering
+    or writing fails only this skill.
+    """
+    problem = validate_spec(config)
+    if problem:
+        name = config.get('name') if isinstance(config, dict) else None
+        return str(name), INVALID, f"⚠️  Invalid spec: {problem}"
+    
+    skill_name = config['name']
+    skill_dir = base_dir / skill_name
+    skill_file = skill_dir / "SKILL.md"
+    
+    if exists and skill_file.exists():
+        return skill_name, SKIPPED, f"⏭️  Skipping {skill_name} (already exists)"
+    
+    try:
+        # Generate first, so a spec that cannot be rendered leaves no directory
+        with skill_profiler.phase('render', skill_name):
+            content = create_skill_md(config)
+        
+        # Create directory
+        if not exists:
+            with skill_profiler.phase('mkdir', skill_name):
+                skill_dir.mkdir(exist_ok=True)
+        
+        with skill_profiler.phase('write', skill_name):
+            skill_file.write_text(content)
+    except Exception as e:
+        return skill_name, FAILED, f"❌ Failed {skill_name}: {type(e).__name__}: {e}"
+    
+    return skill_name, CREATED, f"✅ Created {skill_name}/SKILL.md"
+
+
+def _create_skill_worker(task: Tuple[Path, dict, bool], profile: bool = False) -> Tuple[str, str, str, List[dict]]:
+    """Run create_skill() in a worker; trace events are returned with the result."""
+    if profile:
+        skill_profiler.enable()
+    result = create_skill(*task)
+    events = skill_profiler.active().drain() if profile else []
+    return result + (events,)
+
+
+def create_skills(specs: Iterable[dict], base_dir: Path = BASE_DIR, jobs: int = 1,
+                  batch_size: int = DEFAULT_BATCH_SIZE,
+                  on_batch: Optional[Callable[[List[str]], None]] = None) -> Dict[str, int]:
+    """Create the skills described by `specs` and return a count per status.
+
+    Specs are consumed lazily `batch_size` at a time. Skills that existed
+    before the run are found with one directory scan up front; repeated names
+    in the stream are counted as DUPLICATE after the first, found within a
+    batch by name and across batches by the directory an earlier batch
+    created. Memory is O(existing directories + batch_size), independent of
+    the stream's length. After each batch, `on_batch` receives the names of
+    the skills that batch created.
+    """
+    counts = {CREATED: 0, SKIPPED: 0, DUPLICATE: 0, INVALID: 0, FAILED: 0}
+    existing = scan_skill_dirs(base_dir)
+    
+    profiler = skill_profiler.active()
+    worker = partial(_create_skill_worker, profile=profiler is not None)
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    
+    try:
+        spec_iter = iter(specs)
+        while True:
+            tasks = []
+            seen: Set[str] = set()
+            for config in islice(spec_iter, batch_size):
+                problem = validate_spec(config)
+                if problem:
+                    print(f"⚠️  Invalid spec: {problem}")
+                    counts[INVALID] += 1
+                    continue
+                name = config['name']
+                # Not there before the run but on disk now: an earlier batch made it
+                if name in seen or (name not in existing and (base_dir / name).is_dir()):
+                    print(f"⏭️  Skipping {name} (duplicate spec)")
+                    counts[DUPLICATE] += 1
+                    continue
+                seen.add(name)
+                tasks.append((base_dir, config, name in existing))
+            if not tasks:
+                break
+            
+            if executor is None:
+                results = (create_skill(*task) + ([],) for task in tasks)
+            else:
+                results = executor.map(worker, tasks, chunksize=max(1, len(tasks) // (jobs * 4)))
+            
+            created = []
+            for name, status, message, events in results:
+                print(message)
+                if events:
+                    profiler.extend(events)
+                counts[status] += 1
+                if status == CREATED:
+                    created.append(name)
+            if on_batch is not None and created:
+                on_batch(created)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    return counts
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN FUNCTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
     """Create all missing skills."""
+    parser = argparse.ArgumentParser(description='Create missing Claude Office Skills')
+    parser.add_argument('--specs', type=Path, metavar='FILE',
+                        help='Read skill specs from a JSONL or YAML stream (- for JSONL on stdin) '
+                             'instead of the built-in SKILLS_TO_CREATE')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for rendering and writing (0 = one per CPU)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Specs in flight at once (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--skills-dir', type=Path, default=BASE_DIR,
+                        help='Directory to create the skill folders in (default: repository root)')
+    parser.add_argument('--profile', nargs='?', type=Path, metavar='TRACE_FILE',
+                        const=Path('create_profile.trace.json'),
+                        help='Time each phase per skill and write a Chrome trace '
+                             '(default: create_profile.trace.json)')
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
+    if args.profile:
+        skill_profiler.enable()
     
     print("=" * 60)
     print("Claude Office Skills - Batch Creator")
-    print(f"Creating {len(SKILLS_TO_CREATE)} skills...")
+    if args.specs is None:
+        print(f"Creating {len(SKILLS_TO_CREATE)} skills...")
+    else:
+        print(f"Creating skills from {args.specs}...")
     print("=" * 60)
     
-    created = []
-    skipped = []
+    def report_created(names: List[str]) -> None:
+        print("\nNew skills created:")
+        for skill in names:
+            print(f"  - {skill}/SKILL.md")
+        print()
     
-    for skill_name, config in SKILLS_TO_CREATE.items():
-        skill_dir = BASE_DIR / skill_name
-        skill_file = skill_dir / "SKILL.md"
-        
-        if skill_file.exists():
-            print(f"⏭️  Skipping {skill_name} (already exists)")
-            skipped.append(skill_name)
-            continue
-        
-        # Create directory
-        skill_dir.mkdir(exist_ok=True)
-        
-        # Generate and write SKILL.md
-        content = create_skill_md(config)
-        skill_file.write_text(content)
-        
-        print(f"✅ Created {skill_name}/SKILL.md")
-        created.append(skill_name)
+    counts = create_skills(iter_specs(args.specs), args.skills_dir, jobs, max(1, args.batch_size),
+                           report_created)
     
     print("\n" + "=" * 60)
     print(f"Summary:")
-    print(f"  Created: {len(created)} skills")
-    print(f"  Skipped: {len(skipped)} skills (already exist)")
+    print(f"  Created: {counts[CREATED]} skills")
+    print(f"  Skipped: {counts[SKIPPED]} skills (already exist)")
+    if counts[DUPLICATE]:
+        print(f"  Duplicates: {counts[DUPLICATE]} specs (name repeated in the input)")
+    if counts[INVALID]:
+        print(f"  Invalid: {counts[INVALID]} specs")
+    if counts[FAILED]:
+        print(f"  Failed: {counts[FAILED]} skills")
     print("=" * 60)
     
-    if created:
-        print("\nNew skills created:")
-        for skill in created:
-            print(f"  - {skill}/SKILL.md")
+    if args.profile:
+        profiler = skill_profiler.active()
+        profiler.write_trace(args.profile)
+        print(f"\n⏱️  Phase timings (ms), trace written to {args.profile}\n")
+        profiler.print_summary()
     
-    return created
+    return counts
 
 if __name__ == "__main__":
     main()
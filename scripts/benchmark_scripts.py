@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Benchmark the scripts/ tooling against synthetic skill trees.
+
+Builds throwaway trees of SKILL.md files with realistic frontmatter and body
+sizes and times each phase of the tooling:
+
+    parse    the original regex parser vs parse_skill_file() and the
+             header-only read_frontmatter()
+    render   generate_enhanced_frontmatter() and create_skill_md()
+    write    in-place writes vs a SkillWriteBatch commit
+    upgrade  upgrade_skills() serially and with --jobs
+    main     a full upgrade_skills_metadata.main() run
+
+Results can be saved as JSON (--output) to track regressions over time.
+
+Usage:
+    python3 benchmark_scripts.py [--skills N [N ...]] [--phases PHASE [PHASE ...]]
+                                 [--jobs N] [--repeat N] [--output FILE]
+
+Example (header-only reader at 10k and 100k files):
+    python3 benchmark_scripts.py --skills 10000 100000 --phases parse
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import batch_create_skills as creator
+import upgrade_skills_metadata as upgrader
+from skill_writer import SkillWriteBatch
+
+# Average SKILL.md body in this repo is ~9.5 KB
+DEFAULT_BODY_SIZE = 9500
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+PHASES = ('parse', 'render', 'write', 'upgrade', 'main')
+
+BODY_PARAGRAPH = (
+    "This skill enables efficient processing of office documents. It covers "
+    "extraction, transformation and generation with clear step-by-step guidance.\n\n"
+    "```python\n"
+    "from docx import Document\n\n"
+    "doc = Document()\n"
+    "doc.add_heading('Report', 0)\n"
+    "doc.save('report.docx')\n"
+    "```\n\n"
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SYNTHETIC TREE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def make_skill_tree(root: Path, count: int, body_size: int = DEFAULT_BODY_SIZE) -> List[Path]:
+    """Create `count` skill directories under `root` and return their paths.
+
+    Skill names cycle through SKILL_CATEGORIES so every metadata shape is
+    exercised. Mapped skills get full v2.0 frontmatter; every fourth skill is
+    left unmapped with minimal v1 frontmatter. Calling it again on the same
+    root resets every SKILL.md to its original content.
+    """
+    mapped = sorted(upgrader.SKILL_CATEGORIES)
+    body = (BODY_PARAGRAPH * (body_size // len(BODY_PARAGRAPH) + 1))[:body_size]
+    skill_dirs = []
+
+    for i in range(count):
+        if i % 4 == 3:
+            base = 'unmapped-skill'
+        else:
+            base = mapped[i % len(mapped)]
+        name = f'{base}-{i:06d}'
+        skill_dir = root / name
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        existing = {'name': name, 'description': f'Synthetic benchmark skill {i}'}
+        if base in upgrader.SKILL_CATEGORIES:
+            frontmatter = upgrader.generate_enhanced_frontmatter(base, existing)
+        else:
+            frontmatter = (
+                '---\n'
+                f'name: {name}\n'
+                f'description: "{existing["description"]}"\n'
+                'version: "1.0.0"\n'
+                'author: claude-office-skills\n'
+                'license: MIT\n'
+                '---'
+            )
+        content = f'{frontmatter}\n\n# {name.replace("-", " ").title()} Skill\n\n{body}'
+        (skill_dir / 'SKILL.md').write_text(content, encoding='utf-8')
+        skill_dirs.append(skill_dir)
+
+    return skill_dirs
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TIMING
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Results:
+    """Collects measurements and prints them as they arrive."""
+
+    def __init__(self):
+        self.records: List[dict] = []
+
+    def add(self, phase: str, case: str, count: int, seconds: float,
+            baseline: Optional[float] = None) -> None:
+        rate = count / seconds if seconds else float('inf')
+        line = f"  {case:<30} {seconds:8.3f}s  {rate:10.0f} skills/s"
+        if baseline:
+            line += f"  ({baseline / seconds:.2f}x)"
+        print(line)
+        self.records.append({
+            'phase': phase,
+            'case': case,
+            'skills': count,
+            'seconds': round(seconds, 6),
+            'skills_per_second': round(rate, 1),
+        })
+
+
+def time_call(func: Callable[[], object], repeat: int,
+              setup: Optional[Callable[[], object]] = None) -> float:
+    """Return the best wall-clock time of `repeat` calls, with stdout silenced.
+
+    `setup` runs untimed before every call (e.g. to reset the tree).
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+    return best
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BASELINE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+
+
+def regex_parse_skill_file(file_path: Path):
+    """The regex parser upgrade_skills_metadata.py used before read_frontmatter().
+
+    Kept verbatim as the reference the parse phase is measured against: it
+    reads the whole file and only understands top-level `key: value` lines.
+    """
+    content = file_path.read_text(encoding='utf-8')
+    match = FRONTMATTER_PATTERN.match(content)
+    if match:
+        frontmatter = {}
+        for line in match.group(1).strip().split('\n'):
+            if ':' in line and not line.startswith(' ') and not line.startswith('\t'):
+                key, value = line.split(':', 1)
+                frontmatter[key.strip()] = value.strip().strip('"').strip("'")
+        return frontmatter, match.group(2)
+    return {}, content
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# PHASES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def bench_parse(skill_dirs: List[Path], repeat: int, results: Results) -> None:
+    """Compare the original regex parser with the new readers."""
+    count = len(skill_dirs)
+    skill_files = [d / 'SKILL.md' for d in skill_dirs]
+
+    def regex():
+        for f in skill_files:
+            regex_parse_skill_file(f)
+
+    def full():
+        for f in skill_files:
+            upgrader.parse_skill_file(f)
+
+    def header_only():
+        for f in skill_files:
+            upgrader.read_frontmatter(f)
+
+    regex_time = time_call(regex, repeat)
+    results.add('parse', 'regex (original)', count, regex_time)
+    results.add('parse', 'parse_skill_file', count, time_call(full, repeat), regex_time)
+    results.add('parse', 'read_frontmatter', count, time_call(header_only, repeat), regex_time)
+
+
+def bench_render(skill_dirs: List[Path], repeat: int, results: Results) -> None:
+    """Time the two renderers on pre-parsed input."""
+    count = len(skill_dirs)
+    parsed = [(d.name, upgrader.read_frontmatter(d / 'SKILL.md')[0]) for d in skill_dirs]
+    configs = list(creator.SKILLS_TO_CREATE.values())
+
+    def render_frontmatter():
+        for name, frontmatter in parsed:
+            upgrader.generate_enhanced_frontmatter(name, frontmatter)
+
+    def render_skill_md():
+        for i in range(count):
+            creator.create_skill_md(configs[i % len(configs)])
+
+    results.add('render', 'generate_enhanced_frontmatter', count, time_call(render_frontmatter, repeat))
+    results.add('render', 'create_skill_md', count, time_call(render_skill_md, repeat))
+
+
+def bench_write(skill_dirs: List[Path], repeat: int, results: Results) -> None:
+    """Compare per-file in-place writes with one atomic SkillWriteBatch."""
+    count = len(skill_dirs)
+    contents = [(d / 'SKILL.md', (d / 'SKILL.md').read_bytes()) for d in skill_dirs]
+
+    def in_place():
+        for target, content in contents:
+            target.write_bytes(content)
+
+    def batched():
+        with SkillWriteBatch(skill_dirs[0].parent) as batch:
+            for target, content in contents:
+                batch.stage(target, content)
+
+    in_place_time = time_call(in_place, repeat)
+    results.add('write', 'in-place write_bytes', count, in_place_time)
+    results.add('write', 'SkillWriteBatch', count, time_call(batched, repeat), in_place_time)
+
+
+def bench_upgrade(skill_dirs: List[Path], jobs: int, repeat: int, results: Results,
+                  body_size: int = DEFAULT_BODY_SIZE) -> None:
+    """Compare the serial upgrade loop with the process-pool mode."""
+    count = len(skill_dirs)
+    root = skill_dirs[0].parent
+
+    def reset():
+        make_skill_tree(root, count, body_size)
+
+    serial = time_call(lambda: upgrader.upgrade_skills(skill_dirs, jobs=1), repeat, reset)
+    results.add('upgrade', 'serial', count, serial)
+
+    parallel = time_call(lambda: upgrader.upgrade_skills(skill_dirs, jobs=jobs), repeat, reset)
+    results.add('upgrade', f'--jobs {jobs}', count, parallel, serial)
+
+
+def bench_main(skill_dirs: List[Path], jobs: int, repeat: int, results: Results,
+               body_size: int = DEFAULT_BODY_SIZE) -> None:
+    """Time a full main() run on a fresh tree, then a no-op incremental run.
+
+    `body_size` must match the tree, since every run starts from a reset one.
+    """
+    count = len(skill_dirs)
+    root = skill_dirs[0].parent
+    argv = ['--skills-dir', str(root), '--jobs', str(jobs)]
+    manifest = root / upgrader.MANIFEST_NAME
+
+    def reset():
+        make_skill_tree(root, count, body_size)
+        if manifest.exists():
+            manifest.unlink()
+
+    full = time_call(lambda: upgrader.main(argv), repeat, reset)
+    results.add('main', 'main()', count, full)
+
+    with redirect_stdout(io.StringIO()):
+        reset()
+        upgrader.main(argv + ['--incremental'])
+    incremental = time_call(lambda: upgrader.main(argv + ['--incremental']), repeat)
+    results.add('main', 'main() --incremental, no-op', count, incremental, full)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN FUNCTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark scripts/ tooling')
+    parser.add_argument('--skills', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='Synthetic tree sizes to benchmark (default: 1000 10000 100000)')
+    parser.add_argument('--phases', nargs='+', choices=PHASES, default=list(PHASES),
+                        help='Phases to run')
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help='Worker processes for the parallel run (0 = one per CPU)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best is kept)')
+    parser.add_argument('--body-size', type=int, default=DEFAULT_BODY_SIZE,
+                        help='SKILL.md body size in bytes')
+    parser.add_argument('--output', '-o', type=Path, help='Write results as JSON to this file')
+    args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    print("═" * 60)
+    print("  Claude Office Skills - Scripts Benchmark")
+    print("═" * 60)
+    print()
+
+    results = Results()
+    for count in args.skills:
+        root = Path(tempfile.mkdtemp(prefix='skills-bench-'))
+        try:
+            skill_dirs = make_skill_tree(root, count, args.body_size)
+            print(f"📦 Generated {len(skill_dirs)} synthetic skills in {root}\n")
+            if 'parse' in args.phases:
+                print("⏱️  Frontmatter parsing")
+                bench_parse(skill_dirs, args.repeat, results)
+            if 'render' in args.phases:
+                print("⏱️  Rendering")
+                bench_render(skill_dirs, args.repeat, results)
+            if 'write' in args.phases:
+                print("⏱️  Writing")
+                bench_write(skill_dirs, args.repeat, results)
+            if 'upgrade' in args.phases:
+                print("⏱️  upgrade_skill over the whole tree")
+                bench_upgrade(skill_dirs, jobs, args.repeat, results, args.body_size)
+            if 'main' in args.phases:
+                print("⏱️  Full upgrade_skills_metadata.main() run")
+                bench_main(skill_dirs, jobs, args.repeat, results, args.body_size)
+            print()
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    if args.output:
+        report = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'jobs': jobs,
+            'repeat': args.repeat,
+            'body_size': args.body_size,
+            'results': results.records,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+        print(f"💾 Results saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Skill Catalog Builder
+
+Compiles the frontmatter of every SKILL.md into one indexed SQLite file, so
+tools can list skills by category, department, tag, MCP tool, capability,
+version or language without re-parsing the whole tree.
+
+The catalog uses the same field model and precedence as
+generate_enhanced_frontmatter(): basic information comes from each file's
+frontmatter; categorization comes from SKILL_CATEGORIES, then from the file
+(for skills or keys SKILL_CATEGORIES does not cover), then from the defaults
+used for unmapped skills. Rebuilds are incremental: a
+skill is only re-parsed when its SKILL.md size/mtime and content hash, or its
+SKILL_CATEGORIES entry, have changed.
+
+Usage:
+    python3 skill_catalog.py [--skills-dir DIR] [--db PATH] build [--full]
+    python3 skill_catalog.py [--skills-dir DIR] [--db PATH] query
+                             [--category C] [--department D] [--tag T] [--tool T]
+                             [--capability C] [--version V] [--language L]
+    python3 skill_catalog.py [--skills-dir DIR] [--db PATH] show SKILL_NAME
+"""
+
+import argparse
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import upgrade_skills_metadata as upgrader
+
+CATALOG_NAME = '.skills-catalog.sqlite'
+
+# Bump whenever the schema or the field model changes; older catalogs are rebuilt.
+CATALOG_VERSION = 3
+
+DEFAULT_LANGUAGES = ['en', 'zh']
+
+# Multi-valued fields stored in the facets table: facet -> record key
+FACETS = {
+    'tag': 'tags',
+    'tool': 'mcp_tools',
+    'capability': 'capabilities',
+    'language': 'languages',
+}
+
+# Single-valued fields that can be queried, stored as indexed skills columns
+COLUMNS = ('category', 'department', 'version')
+
+QUERY_FIELDS = COLUMNS + tuple(FACETS)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS skills (
+    name        TEXT PRIMARY KEY,
+    path        TEXT NOT NULL,
+    description TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    author      TEXT NOT NULL,
+    license     TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    department  TEXT NOT NULL,
+    mcp_server  TEXT,
+    size        INTEGER NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    source_hash TEXT NOT NULL,
+    meta_hash   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS skills_category ON skills (category);
+CREATE INDEX IF NOT EXISTS skills_department ON skills (department);
+CREATE INDEX IF NOT EXISTS skills_version ON skills (version);
+
+CREATE TABLE IF NOT EXISTS facets (
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    skill TEXT NOT NULL REFERENCES skills (name) ON DELETE CASCADE,
+    PRIMARY KEY (facet, value, skill)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS facets_skill ON facets (skill);
+"""
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FIELD MODEL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _as_list(value) -> Optional[List[str]]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, list):
+        return [str(v) for v in value if not isinstance(v, (dict, list))]
+    return [str(value)]
+
+
+def _as_text(value) -> Optional[str]:
+    """A non-empty string value, or None for missing, empty and nested values."""
+    return value if isinstance(value, str) and value else None
+
+
+def catalog_record(skill_name: str, frontmatter: dict) -> dict:
+    """Resolve the catalog fields of a skill from its parsed frontmatter.
+
+    Every column gets a string: nested maps and lists where the catalog
+    expects a scalar fall back to the defaults, like missing values.
+    """
+    mcp = frontmatter.get('mcp') if isinstance(frontmatter.get('mcp'), dict) else {}
+
+    # SKILL_CATEGORIES wins over the file, as in the upgrader; values declared
+    # in the file only fill what it does not cover
+    declared = {
+        'category': _as_text(frontmatter.get('category')),
+        'department': _as_text(frontmatter.get('department')),
+        'tags': _as_list(frontmatter.get('tags')),
+        'mcp_tools': _as_list(mcp.get('tools')),
+        'capabilities': _as_list(frontmatter.get('capabilities')),
+    }
+    metadata = {k: v for k, v in declared.items() if v is not None}
+    metadata.update(upgrader.SKILL_CATEGORIES.get(skill_name, {}))
+
+    record = upgrader.resolve_skill_fields(skill_name, frontmatter, metadata)
+    record['mcp_server'] = _as_text(mcp.get('server')) or ('office-mcp' if record['mcp_tools'] else None)
+    record['languages'] = _as_list(frontmatter.get('languages')) or list(DEFAULT_LANGUAGES)
+    return record
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CATALOG
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class SkillCatalog:
+    """Indexed SQLite catalog of skill frontmatter."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] != CATALOG_VERSION:
+            self._reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _reset(self) -> None:
+        with self.conn:
+            self.conn.execute('DROP TABLE IF EXISTS facets')
+            self.conn.execute('DROP TABLE IF EXISTS skills')
+            self.conn.executescript(SCHEMA)
+            self.conn.execute(f'PRAGMA user_version = {CATALOG_VERSION}')
+
+    # ── Building ────────────────────────────────────────────────────────────
+
+    def build(self, skills_dir: Path, full: bool = False) -> Dict[str, int]:
+        """Bring the catalog in sync with `skills_dir`.
+
+        Returns counts of added, updated, unchanged and removed skills.
+        """
+        if full:
+            self._reset()
+
+        counts = {'added': 0, 'updated': 0, 'unchanged': 0, 'removed': 0}
+        known = {
+            row['name']: row for row in self.conn.execute(
+                'SELECT name, size, mtime_ns, source_hash, meta_hash FROM skills')
+        }
+        seen = set()
+
+        with self.conn:
+            for skill_dir in sorted(upgrader.find_skill_dirs(Path(skills_dir))):
+                skill_file = skill_dir / 'SKILL.md'
+                if not skill_file.is_file():
+                    continue
+                name = skill_dir.name
+                seen.add(name)
+                status = self._sync_skill(name, skill_file, known.get(name))
+                counts[status] += 1
+
+            for name in set(known) - seen:
+                self.conn.execute('DELETE FROM skills WHERE name = ?', (name,))
+                counts['removed'] += 1
+
+        return counts
+
+    def _sync_skill(self, name: str, skill_file: Path, row: Optional[sqlite3.Row]) -> str:
+        meta_hash = upgrader.metadata_hash(name)
+        stat = skill_file.stat()
+
+        if row is not None and row['meta_hash'] == meta_hash:
+            if row['size'] == stat.st_size and row['mtime_ns'] == stat.st_mtime_ns:
+                return 'unchanged'
+
+        raw = skill_file.read_bytes()
+        source_hash = hashlib.sha256(raw).hexdigest()
+
+        if row is not None and row['meta_hash'] == meta_hash and row['source_hash'] == source_hash:
+            self.conn.execute('UPDATE skills SET size = ?, mtime_ns = ? WHERE name = ?',
+                              (stat.st_size, stat.st_mtime_ns, name))
+            return 'unchanged'
+
+        frontmatter, _ = upgrader.split_frontmatter(raw.decode('utf-8'))
+        record = catalog_record(name, frontmatter)
+
+        self.conn.execute('DELETE FROM skills WHERE name = ?', (name,))
+        self.conn.execute(
+            'INSERT INTO skills (name, path, description, version, author, license, category,'
+            ' department, mcp_server, size, mtime_ns, source_hash, meta_hash)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (name, str(skill_file), record['description'], record['version'], record['author'],
+             record['license'], record['category'], record['department'], record['mcp_server'],
+             stat.st_size, stat.st_mtime_ns, source_hash, meta_hash),
+        )
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO facets (facet, value, skill) VALUES (?, ?, ?)',
+            [(facet, value, name) for facet, key in FACETS.items() for value in record[key]],
+        )
+        return 'added' if row is None else 'updated'
+
+    # ── Queries ─────────────────────────────────────────────────────────────
+
+    def find(self, **criteria: str) -> List[str]:
+        """Return sorted skill names matching every given criterion.
+
+        Keys are any of QUERY_FIELDS: category, department, version, tag,
+        tool, capability or language.
+        """
+        clauses = []
+        params: List[str] = []
+        for key, value in criteria.items():
+            if key in COLUMNS:
+                clauses.append(f'SELECT name FROM skills WHERE {key} = ?')
+            elif key in FACETS:
+                clauses.append('SELECT skill FROM facets WHERE facet = ? AND value = ?')
+                params.append(key)
+            else:
+                raise ValueError(f"Unknown catalog field: {key}")
+            params.append(value)
+
+        sql = ' INTERSECT '.join(clauses) if clauses else 'SELECT name FROM skills'
+        return sorted(row[0] for row in self.conn.execute(sql, params))
+
+    def skills_using_tool(self, tool: str) -> List[str]:
+        return self.find(tool=tool)
+
+    def skills_with_tag(self, tag: str) -> List[str]:
+        return self.find(tag=tag)
+
+    def skills_with_capability(self, capability: str) -> List[str]:
+        return self.find(capability=capability)
+
+    def skills_in_category(self, category: str) -> List[str]:
+        return self.find(category=category)
+
+    def skills_in_department(self, department: str) -> List[str]:
+        return self.find(department=department)
+
+    def records(self) -> List[dict]:
+        """Return the catalog records of every skill, sorted by name."""
+        return [self.get(row[0]) for row in self.conn.execute('SELECT name FROM skills ORDER BY name')]
+
+    def fingerprint(self) -> str:
+        """Hash of every skill's source and SKILL_CATEGORIES hashes.
+
+        Changes whenever a build changes any record, so files derived from
+        the catalog (e.g. skills-index.json) can tell when they are stale.
+        """
+        digest = hashlib.sha256()
+        for row in self.conn.execute('SELECT name, source_hash, meta_hash FROM skills ORDER BY name'):
+            digest.update('\0'.join(row).encode('utf-8') + b'\n')
+        return digest.hexdigest()
+
+    def get(self, name: str) -> Optional[dict]:
+        """Return the full catalog record of a skill, or None."""
+        row = self.conn.execute('SELECT * FROM skills WHERE name = ?', (name,)).fetchone()
+        if row is None:
+            return None
+        record = {k: row[k] for k in row.keys() if k not in ('size', 'mtime_ns', 'source_hash', 'meta_hash')}
+        for key in FACETS.values():
+            record[key] = []
+        for facet, value in self.conn.execute(
+                'SELECT facet, value FROM facets WHERE skill = ? ORDER BY facet, value', (name,)):
+            record[FACETS[facet]].append(value)
+        return record
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN FUNCTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and query the skill catalog')
+    parser.add_argument('--skills-dir', type=Path, default=Path(__file__).parent.parent,
+                        help='Root of the skills tree (default: the repository root)')
+    parser.add_argument('--db', type=Path,
+                        help=f'Catalog path (default: <skills>/{CATALOG_NAME})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='Build or incrementally update the catalog')
+    build.add_argument('--full', action='store_true', help='Rebuild from scratch')
+
+    query = sub.add_parser('query', help='List skills matching all given filters')
+    for field in QUERY_FIELDS:
+        query.add_argument(f'--{field}', type=str)
+
+    show = sub.add_parser('show', help='Show the catalog record of one skill')
+    show.add_argument('skill', type=str)
+
+    args = parser.parse_args()
+    db_path = args.db or args.skills_dir / CATALOG_NAME
+
+    with SkillCatalog(db_path) as catalog:
+        if args.command == 'build':
+            counts = catalog.build(args.skills_dir, full=args.full)
+            print(f"📚 Catalog {db_path.name}: {counts['added']} added, {counts['updated']} updated, "
+                  f"{counts['unchanged']} unchanged, {counts['removed']} removed")
+        elif args.command == 'query':
+            criteria = {f: getattr(args, f) for f in QUERY_FIELDS if getattr(args, f)}
+            for name in catalog.find(**criteria):
+                print(name)
+        else:
+            record = catalog.get(args.skill)
+            if record is None:
+                print(f"❌ Skill not found: {args.skill}")
+                return
+            for key, value in record.items():
+                print(f"{key}: {value}")
+
+
+if __name__ == '__main__':
+    main()
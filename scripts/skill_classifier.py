@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Skill Auto-Categorizer
+
+SKILL_CATEGORIES only covers part of the skill directories; every other skill
+is upgraded with `category: productivity` and a single tag derived from its
+name. This script proposes real metadata for those skills by comparing their
+SKILL.md text with the mapped skills:
+
+    1. one TF-IDF matrix is built over all SKILL.md bodies (sparse, CSR)
+    2. unmapped rows are scored against mapped rows in chunks of bounded size
+       (cosine similarity, rows are L2-normalised): a dense product over the
+       most frequent terms plus a sparse product over the rest
+    3. only the top-k neighbours of each row are kept; they vote on category, department, tags and MCP tools
+       through matrix products with one-hot label matrices
+
+Each proposal carries a confidence in [0, 1]: the share of neighbour
+similarity that agrees with the proposed category.
+
+Requires numpy and scipy (pip install numpy scipy).
+
+Usage:
+    python3 skill_classifier.py [--skills-dir PATH] [--skill NAME] [--top-k N]
+                                [--min-confidence X] [--output FILE] [--emit]
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # optional dependency, checked in main()
+    np = None
+    sparse = None
+
+import upgrade_skills_metadata as upgrader
+
+TOKEN_PATTERN = re.compile(r'[a-z][a-z0-9_]+')
+
+DEFAULT_TOP_K = 5
+
+# Similarity scores (unmapped rows x mapped skills) computed per chunk: the
+# chunk's rows shrink as the mapped set grows, so peak memory stays bounded on
+# huge trees (2**24 float32 scores are 64 MB)
+CHUNK_ELEMENTS = 2 ** 24
+
+# Most frequent terms scored with a dense product instead of a sparse one
+DENSE_TERMS = 1024
+
+# A tag or tool is proposed when its neighbours' vote reaches this share
+LABEL_THRESHOLD = 0.4
+MAX_TAGS = 5
+MAX_TOOLS = 4
+
+STOP_WORDS = frozenset("""
+    a an and are as at be by can for from has have how if in into is it its of on or
+    that the their then this to use used uses using was will with you your yes no not
+    all any each more most other some such than too very via per also only out up
+    example examples skill skills claude python import def return print true false none
+""".split())
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TF-IDF
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def build_tfidf(documents: List[str], min_df: int = 2):
+    """Return an L2-normalised TF-IDF matrix (CSR, one row per document).
+
+    Term frequencies are sublinear (1 + log tf). Terms found in fewer than
+    `min_df` documents are dropped.
+    """
+    # Count tokens per document in C (Counter), then map only the distinct
+    # tokens to column ids; unseen tokens get the next id on first lookup.
+    # Stop words are dropped as columns afterwards.
+    vocabulary: Dict[str, int] = defaultdict()
+    vocabulary.default_factory = vocabulary.__len__
+    indices = []
+    data = []
+    indptr = [0]
+    for text in documents:
+        counter = Counter(TOKEN_PATTERN.findall(text.lower()))
+        indices.append(np.fromiter(map(vocabulary.__getitem__, counter), np.int32, len(counter)))
+        data.append(np.fromiter(counter.values(), np.float32, len(counter)))
+        indptr.append(indptr[-1] + len(counter))
+
+    counts = sparse.csr_matrix(
+        (np.concatenate(data) if data else np.zeros(0, dtype=np.float32),
+         np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32),
+         np.asarray(indptr, dtype=np.int64)),
+        shape=(len(documents), len(vocabulary)),
+    )
+
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+    keep = df >= min_df if len(documents) > min_df else np.ones(counts.shape[1], dtype=bool)
+    for token in STOP_WORDS.intersection(vocabulary):
+        keep[vocabulary[token]] = False
+    keep = np.flatnonzero(keep)
+    counts = counts[:, keep]
+    df = df[keep]
+
+    counts.data = 1.0 + np.log(counts.data)
+    idf = np.log((1.0 + len(documents)) / (1.0 + df)) + 1.0
+    tfidf = counts @ sparse.diags(idf.astype(np.float32))
+
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.csr_matrix(sparse.diags(1.0 / norms) @ tfidf)
+
+
+def label_matrix(label_lists: List[List[str]]):
+    """One-hot/multi-hot encode labels: returns (CSR matrix, label names)."""
+    names = sorted({label for labels in label_lists for label in labels})
+    index = {name: i for i, name in enumerate(names)}
+    rows, cols = [], []
+    for row, labels in enumerate(label_lists):
+        for label in set(labels):
+            rows.append(row)
+            cols.append(index[label])
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+        shape=(len(label_lists), len(names)),
+    )
+    return matrix, names
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLASSIFICATION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ReferenceIndex:
+    """Rows of a TF-IDF matrix prepared for repeated cosine scoring.
+
+    Terms that occur in most documents make a sparse product nearly dense,
+    and sparse products are slow when dense. The `dense_terms` most frequent
+    columns are therefore scored with a dense (BLAS) product, and only the
+    remaining rare terms with a sparse one. The sum is the exact similarity.
+    """
+
+    def __init__(self, references, dense_terms: int = DENSE_TERMS):
+        df = np.bincount(references.indices, minlength=references.shape[1])
+        order = np.argsort(-df, kind='stable')
+        self.frequent, self.rare = order[:dense_terms], order[dense_terms:]
+        self.frequent_t = np.ascontiguousarray(references[:, self.frequent].toarray().T)
+        self.rare_t = references[:, self.rare].T.tocsr()
+        self.size = references.shape[0]
+
+    def similarities(self, queries):
+        """Dense (n_queries, size) float32 cosine similarities."""
+        scores = queries[:, self.frequent].toarray() @ self.frequent_t
+        scores += (queries[:, self.rare] @ self.rare_t).toarray()
+        return scores
+
+
+def top_k_similarities(queries, references: ReferenceIndex, k: int):
+    """Cosine similarities of `queries` to their k nearest `references`.
+
+    Returns (indices, scores), both (n_queries, k) arrays sorted best first.
+    Only the k best entries per row are kept; callers bound n_queries so the
+    (n_queries, n_references) scores of one call fit in CHUNK_ELEMENTS.
+    """
+    k = min(k, references.size)
+    similarities = references.similarities(queries)
+    if k < similarities.shape[1]:
+        indices = np.argpartition(similarities, -k, axis=1)[:, -k:]
+    else:
+        indices = np.broadcast_to(np.arange(k), similarities.shape)
+    scores = np.take_along_axis(similarities, indices, axis=1)
+    order = np.argsort(-scores, axis=1)
+    return np.take_along_axis(indices, order, axis=1), np.take_along_axis(scores, order, axis=1)
+
+
+def classify_skills(documents: Dict[str, str], categories: Dict[str, dict],
+                    top_k: int = DEFAULT_TOP_K) -> Dict[str, dict]:
+    """Propose SKILL_CATEGORIES entries for the documents not in `categories`.
+
+    `documents` maps skill names to SKILL.md text. Returns
+    {skill: {category, department, tags, mcp_tools, confidence, neighbours}}.
+    """
+    names = sorted(documents)
+    mapped = [n for n in names if n in categories]
+    unmapped = [n for n in names if n not in categories]
+    if not mapped or not unmapped:
+        return {}
+
+    tfidf = build_tfidf([documents[n] for n in names])
+    row_of = {name: i for i, name in enumerate(names)}
+    references = ReferenceIndex(tfidf[[row_of[n] for n in mapped]])
+
+    entries = [categories[n] for n in mapped]
+    category_m, category_names = label_matrix([[e.get('category', 'productivity')] for e in entries])
+    department_m, department_names = label_matrix([[e.get('department', 'All')] for e in entries])
+    tag_m, tag_names = label_matrix([e.get('tags', []) for e in entries])
+    tool_m, tool_names = label_matrix([e.get('mcp_tools', []) for e in entries])
+
+    proposals = {}
+    chunk_size = max(1, CHUNK_ELEMENTS // len(mapped))
+    for start in range(0, len(unmapped), chunk_size):
+        chunk = unmapped[start:start + chunk_size]
+        neighbours, scores = top_k_similarities(tfidf[[row_of[n] for n in chunk]], references, top_k)
+        k = neighbours.shape[1]
+        # Sparse (chunk, mapped) weights holding only the k neighbours of each row
+        similarities = sparse.csr_matrix(
+            (scores.ravel(), neighbours.ravel(), np.arange(0, len(chunk) * k + 1, k)),
+            shape=(len(chunk), len(mapped)),
+        )
+        weight = scores.sum(axis=1)
+        weight[weight == 0] = 1.0
+
+        category_votes = (similarities @ category_m).toarray()
+        department_votes = (similarities @ department_m).toarray()
+        tag_share = (similarities @ tag_m).toarray() / weight[:, None]
+        tool_share = (similarities @ tool_m).toarray() / weight[:, None]
+
+        best_category = category_votes.argmax(axis=1)
+        best_department = department_votes.argmax(axis=1)
+        confidence = category_votes.max(axis=1) / weight
+        tags = _pick_labels(tag_share, tag_names, MAX_TAGS)
+        tools = _pick_labels(tool_share, tool_names, MAX_TOOLS)
+
+        for i, name in enumerate(chunk):
+            proposals[name] = {
+                'category': category_names[best_category[i]],
+                'department': department_names[best_department[i]],
+                'tags': tags[i],
+                'mcp_tools': tools[i],
+                'confidence': round(float(confidence[i]), 3),
+                'neighbours': [mapped[j] for j, score in zip(neighbours[i], scores[i]) if score > 0],
+            }
+    return proposals
+
+
+def _pick_labels(shares, names: List[str], limit: int) -> List[List[str]]:
+    """Per row, the labels (best first) whose vote share reaches LABEL_THRESHOLD."""
+    order = np.argsort(-shares, axis=1)[:, :limit]
+    selected = np.take_along_axis(shares, order, axis=1) >= LABEL_THRESHOLD
+    return [[names[j] for j in row[mask]] for row, mask in zip(order, selected)]
+
+
+def load_documents(skill_dirs: List[Path]) -> Dict[str, str]:
+    """Read every SKILL.md as description + body text, keyed by skill name."""
+    documents = {}
+    for skill_dir in skill_dirs:
+        skill_file = skill_dir / 'SKILL.md'
+        if not skill_file.exists():
+            continue
+        frontmatter, body = upgrader.parse_skill_file(skill_file)
+        documents[skill_dir.name] = f"{frontmatter.get('description', '')}\n{body}"
+    return documents
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN FUNCTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Propose metadata for skills missing from SKILL_CATEGORIES')
+    parser.add_argument('--skills-dir', type=Path, default=Path(__file__).parent.parent,
+                        help='Directory containing the skill folders (default: repository root)')
+    parser.add_argument('--skill', type=str, help='Only print the proposal for this skill')
+    parser.add_argument('--top-k', type=int, default=DEFAULT_TOP_K,
+                        help=f'Mapped neighbours that vote on each proposal (default: {DEFAULT_TOP_K})')
+    parser.add_argument('--min-confidence', type=float, default=0.0,
+                        help='Hide proposals below this confidence')
+    parser.add_argument('--output', '-o', type=Path, help='Write proposals as JSON to this file')
+    parser.add_argument('--emit', action='store_true',
+                        help='Print proposals as SKILL_CATEGORIES entries ready to review and paste')
+    args = parser.parse_args(argv)
+
+    if np is None or sparse is None:
+        print("❌ skill_classifier.py requires numpy and scipy: pip install numpy scipy")
+        return 1
+
+    documents = load_documents(upgrader.find_skill_dirs(args.skills_dir))
+    proposals = classify_skills(documents, upgrader.SKILL_CATEGORIES, args.top_k)
+    if args.skill:
+        proposals = {k: v for k, v in proposals.items() if k == args.skill}
+    proposals = {k: v for k, v in proposals.items() if v['confidence'] >= args.min_confidence}
+
+    if args.output:
+        args.output.write_text(json.dumps(proposals, indent=2) + '\n', encoding='utf-8')
+        print(f"💾 Wrote {len(proposals)} proposals to {args.output}")
+    elif args.emit:
+        for name, p in proposals.items():
+            print(f"    # confidence {p['confidence']:.2f}, like {', '.join(p['neighbours'][:3])}")
+            print(f"    {json.dumps(name)}: {{")
+            for field in ('category', 'tags', 'department', 'mcp_tools'):
+                print(f"        {json.dumps(field)}: {json.dumps(p[field])},")
+            print("    },")
+    else:
+        print(f"🔎 {len(proposals)} proposals for skills missing from SKILL_CATEGORIES\n")
+        for name, p in sorted(proposals.items(), key=lambda item: -item[1]['confidence']):
+            print(f"  {p['confidence']:.2f}  {name:<28} {p['category']:<14} "
+                  f"tags: {', '.join(p['tags']) or '-'}  tools: {', '.join(p['mcp_tools']) or '-'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Reverse Skill Indexes
+
+The skill catalog (skill_catalog.py) resolves each skill's MCP tools,
+capabilities, tags and department from SKILL_CATEGORIES and from the
+SKILL.md itself. This script inverts those fields (tool -> skills, ...) and
+persists them as skills-index.json next to the skills, so questions like
+"which skills break if fill_docx_template changes?" are a single dict
+lookup instead of a scan over the mapping and every SKILL.md.
+
+The index records the catalog fingerprint it was built from. `build`
+refreshes the catalog and rewrites the index; lookups rebuild it only when
+the file is missing or the catalog has changed since.
+
+Usage:
+    python3 skill_index.py [--skills-dir DIR] [--index PATH] build
+    python3 skill_index.py [--skills-dir DIR] [--index PATH] lookup {tool,capability,tag,department} VALUE
+    python3 skill_index.py [--skills-dir DIR] [--index PATH] list {tool,capability,tag,department}
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from skill_catalog import CATALOG_NAME, SkillCatalog
+
+INDEX_NAME = 'skills-index.json'
+INDEX_VERSION = 2
+
+# Index kind -> catalog record field it inverts
+INDEX_FIELDS = {
+    'tool': 'mcp_tools',
+    'capability': 'capabilities',
+    'tag': 'tags',
+    'department': 'department',
+}
+
+
+def build_indexes(records: Iterable[dict]) -> Dict[str, Dict[str, List[str]]]:
+    """Invert catalog records into {kind: {value: sorted skill names}}."""
+    indexes: Dict[str, Dict[str, List[str]]] = {kind: {} for kind in INDEX_FIELDS}
+    for record in sorted(records, key=lambda r: r['name']):
+        for kind, field in INDEX_FIELDS.items():
+            values = record.get(field) or []
+            if isinstance(values, str):
+                values = [values]
+            for value in values:
+                skills = indexes[kind].setdefault(value, [])
+                if record['name'] not in skills:
+                    skills.append(record['name'])
+    return {kind: dict(sorted(index.items())) for kind, index in indexes.items()}
+
+
+class SkillIndex:
+    """Constant-time reverse lookups over the skill catalog."""
+
+    def __init__(self, indexes: Dict[str, Dict[str, List[str]]], source_hash: str):
+        self.indexes = indexes
+        self.source_hash = source_hash
+
+    @classmethod
+    def from_catalog(cls, catalog: SkillCatalog) -> 'SkillIndex':
+        return cls(build_indexes(catalog.records()), catalog.fingerprint())
+
+    @classmethod
+    def load(cls, index_path: Path, source_hash: Optional[str] = None) -> Optional['SkillIndex']:
+        """Load a persisted index, or None if it is missing, outdated or stale.
+
+        With `source_hash` (a SkillCatalog.fingerprint()), an index built from
+        a different catalog state counts as stale.
+        """
+        try:
+            data = json.loads(Path(index_path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != INDEX_VERSION:
+            return None
+        if source_hash is not None and data.get('source') != source_hash:
+            return None
+        return cls(data['indexes'], data['source'])
+
+    def save(self, index_path: Path) -> None:
+        data = {'version': INDEX_VERSION, 'source': self.source_hash, 'indexes': self.indexes}
+        tmp_path = Path(index_path).with_name(Path(index_path).name + '.tmp')
+        tmp_path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+        os.replace(tmp_path, index_path)
+
+    def lookup(self, kind: str, value: str) -> List[str]:
+        """Return the skills whose `kind` (tool, capability, tag, department) includes `value`."""
+        if kind not in INDEX_FIELDS:
+            raise ValueError(f"Unknown index: {kind}")
+        return list(self.indexes[kind].get(value, []))
+
+    def skills_using_tool(self, tool: str) -> List[str]:
+        return self.lookup('tool', tool)
+
+    def skills_with_capability(self, capability: str) -> List[str]:
+        return self.lookup('capability', capability)
+
+    def skills_with_tag(self, tag: str) -> List[str]:
+        return self.lookup('tag', tag)
+
+    def skills_in_department(self, department: str) -> List[str]:
+        return self.lookup('department', department)
+
+    def values(self, kind: str) -> Dict[str, int]:
+        """Return every indexed value of `kind` with its skill count."""
+        if kind not in INDEX_FIELDS:
+            raise ValueError(f"Unknown index: {kind}")
+        return {value: len(skills) for value, skills in self.indexes[kind].items()}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN FUNCTION
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and query reverse skill indexes')
+    parser.add_argument('--skills-dir', type=Path, default=Path(__file__).parent.parent,
+                        help='Root of the skills tree (default: the repository root)')
+    parser.add_argument('--index', type=Path,
+                        help=f'Index path (default: <skills>/{INDEX_NAME})')
+    parser.add_argument('--db', type=Path,
+                        help=f'Catalog path (default: <skills>/{CATALOG_NAME})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('build', help='Refresh the catalog and rebuild the index file')
+
+    lookup = sub.add_parser('lookup', help='List skills that use a tool, capability, tag or department')
+    lookup.add_argument('kind', choices=list(INDEX_FIELDS))
+    lookup.add_argument('value', type=str)
+
+    listing = sub.add_parser('list', help='List indexed values with skill counts')
+    listing.add_argument('kind', choices=list(INDEX_FIELDS))
+
+    args = parser.parse_args()
+    index_path = args.index or args.skills_dir / INDEX_NAME
+    db_path = args.db or args.skills_dir / CATALOG_NAME
+
+    with SkillCatalog(db_path) as catalog:
+        if args.command == 'build':
+            catalog.build(args.skills_dir)
+            index = SkillIndex.from_catalog(catalog)
+            index.save(index_path)
+            sizes = ', '.join(f"{kind}: {len(index.indexes[kind])}" for kind in INDEX_FIELDS)
+            print(f"🗂️  Wrote {index_path.name}: {sizes}")
+            return
+
+        if not catalog.find():   # no catalog yet
+            catalog.build(args.skills_dir)
+        index = SkillIndex.load(index_path, catalog.fingerprint())
+        if index is None:
+            index = SkillIndex.from_catalog(catalog)
+            index.save(index_path)
+
+    if args.command == 'lookup':
+        skills = index.lookup(args.kind, args.value)
+        if not skills:
+            print(f"❌ No skills found for {args.kind}: {args.value}")
+        for name in skills:
+            print(name)
+    else:
+        for value, count in index.values(args.kind).items():
+            print(f"{count:4d}  {value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Per-Skill Phase Profiler
+
+Records how long each phase (read, parse, render, write, ...) takes for every
+skill, writes the result as a Chrome trace-event file (open it in
+chrome://tracing or https://ui.perfetto.dev) and prints an aggregate
+percentile table plus the slowest skills.
+
+Profiling is off until enable() is called; phase() is then a cheap no-op, so
+the scripts can stay instrumented permanently.
+
+    import skill_profiler
+
+    skill_profiler.enable()
+    with skill_profiler.phase('parse', skill_name):
+        ...
+    skill_profiler.active().write_trace(Path('profile.trace.json'))
+    skill_profiler.active().print_summary()
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class Profiler:
+    """Collects complete ('X') trace events, one per phase per skill."""
+
+    def __init__(self):
+        self.events: List[dict] = []
+
+    @contextmanager
+    def phase(self, name: str, skill: str, category: str = 'skill'):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.events.append({
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': start / 1000,
+                'dur': (end - start) / 1000,
+                'pid': os.getpid(),
+                'tid': threading.get_native_id(),
+                'args': {'skill': skill},
+            })
+
+    def extend(self, events: List[dict]) -> None:
+        """Merge events recorded in another process."""
+        self.events.extend(events)
+
+    def drain(self) -> List[dict]:
+        """Return and forget the events recorded so far."""
+        events, self.events = self.events, []
+        return events
+
+    def write_trace(self, path: Path) -> None:
+        """Write a Chrome trace-event JSON file."""
+        base = min((e['ts'] for e in self.events), default=0)
+        events = [dict(e, ts=round(e['ts'] - base, 3), dur=round(e['dur'], 3)) for e in self.events]
+        Path(path).write_text(json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'}),
+                              encoding='utf-8')
+
+    def summary(self) -> Dict[str, dict]:
+        """Aggregate durations (ms) per phase: count, total, mean, p50, p90, p99, max."""
+        durations: Dict[str, List[float]] = {}
+        for event in self.events:
+            durations.setdefault(event['name'], []).append(event['dur'] / 1000)
+
+        stats = {}
+        for name, values in durations.items():
+            values.sort()
+            stats[name] = {
+                'count': len(values),
+                'total': sum(values),
+                'mean': sum(values) / len(values),
+                'p50': _percentile(values, 50),
+                'p90': _percentile(values, 90),
+                'p99': _percentile(values, 99),
+                'max': values[-1],
+            }
+        return stats
+
+    def slowest_skills(self, top: int = 10) -> List[tuple]:
+        """Return [(skill, total_ms, slowest_phase)] for the slowest skills."""
+        totals: Dict[str, Dict[str, float]] = {}
+        for event in self.events:
+            if event['cat'] != 'skill':
+                continue
+            phases = totals.setdefault(event['args']['skill'], {})
+            phases[event['name']] = phases.get(event['name'], 0.0) + event['dur'] / 1000
+        ranked = sorted(totals.items(), key=lambda item: sum(item[1].values()), reverse=True)
+        return [(skill, sum(p.values()), max(p, key=p.get)) for skill, p in ranked[:top]]
+
+    def print_summary(self, top: int = 10) -> None:
+        print(f"  {'Phase':<10} {'Count':>7} {'Total ms':>10} {'Mean':>8} "
+              f"{'p50':>8} {'p90':>8} {'p99':>8} {'Max':>8}")
+        for name, s in self.summary().items():
+            print(f"  {name:<10} {s['count']:>7d} {s['total']:>10.1f} {s['mean']:>8.3f} "
+                  f"{s['p50']:>8.3f} {s['p90']:>8.3f} {s['p99']:>8.3f} {s['max']:>8.3f}")
+
+        slowest = self.slowest_skills(top)
+        if slowest:
+            print(f"\n  Slowest {len(slowest)} skills:")
+            for skill, total, phase_name in slowest:
+                print(f"    {total:8.3f} ms  {skill}  (mostly {phase_name})")
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+_active: Optional[Profiler] = None
+
+
+def enable() -> Profiler:
+    """Turn profiling on for this process and return the profiler."""
+    global _active
+    if _active is None:
+        _active = Profiler()
+    return _active
+
+
+def active() -> Optional[Profiler]:
+    return _active
+
+
+def phase(name: str, skill: str, category: str = 'skill'):
+    """Time a phase if profiling is enabled, otherwise do nothing."""
+    if _active is None:
+        return nullcontext()
+    return _active.phase(name, skill, category)
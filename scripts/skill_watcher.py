@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Skill Watcher
+
+Watch mode for upgrade_skills_metadata.py. Subscribes to Linux inotify
+events for the skills root, debounces bursts of edits and re-runs
+upgrade_skill() only for the skill directories that changed. Edits to
+SKILL_CATEGORIES in upgrade_skills_metadata.py are diffed per skill, and
+only the skills whose entries changed are re-upgraded.
+
+inotify is called through ctypes, so no extra dependency is needed.
+
+Usage:
+    python3 upgrade_skills_metadata.py --watch [--debounce SECONDS] [--incremental]
+                                       [--batch-size N] [--in-place]
+"""
+
+import ast
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+import upgrade_skills_metadata as upgrader
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+ROOT_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+SKILL_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+SCRIPT_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+EVENT_HEADER = struct.Struct('iIII')
+
+DEFAULT_DEBOUNCE = 0.5
+
+
+class Inotify:
+    """Minimal ctypes binding to the Linux inotify API."""
+
+    def __init__(self):
+        if not sys.platform.startswith('linux'):
+            raise OSError("--watch requires Linux (inotify)")
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.paths: Dict[int, Path] = {}
+
+    def add_watch(self, path: Path, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+        self.paths[wd] = Path(path)
+        return wd
+
+    def read_events(self):
+        """Yield (watched_path, mask, name) for all queued events."""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += length
+            if mask & IN_IGNORED:
+                self.paths.pop(wd, None)
+                continue
+            yield self.paths.get(wd), mask, name
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def load_skill_categories(script_path: Path) -> Optional[Dict[str, dict]]:
+    """Read SKILL_CATEGORIES from the upgrader source without importing it.
+
+    Returns None if the file cannot be parsed (e.g. it is mid-edit).
+    """
+    try:
+        tree = ast.parse(script_path.read_text(encoding='utf-8'))
+    except (OSError, SyntaxError):
+        return None
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == 'SKILL_CATEGORIES' for t in node.targets):
+            try:
+                return ast.literal_eval(node.value)
+            except ValueError:
+                return None
+    return None
+
+
+def changed_category_entries(old: Dict[str, dict], new: Dict[str, dict]) -> Set[str]:
+    """Return the skills whose SKILL_CATEGORIES entry was added, removed or edited."""
+    return {name for name in set(old) | set(new) if old.get(name) != new.get(name)}
+
+
+def watch_skills(skills_dir: Path, script_path: Path, dry_run: bool = False, jobs: int = 1,
+                 manifest: Optional[Dict[str, dict]] = None,
+                 manifest_path: Optional[Path] = None,
+                 debounce: float = DEFAULT_DEBOUNCE,
+                 batch_size: int = upgrader.DEFAULT_BATCH_SIZE, atomic: bool = True) -> None:
+    """Re-upgrade changed skills until interrupted.
+
+    `manifest` is kept in memory so the watcher's own writes are recognised
+    and skipped; it is saved to `manifest_path` after each batch if given.
+    `batch_size` and `atomic` are passed to upgrade_skills(), so watch mode
+    writes files the same way as a one-shot run.
+    """
+    skills_dir = Path(skills_dir)
+    script_path = Path(script_path).resolve()
+    manifest = manifest if manifest is not None else {}
+    skill_names = {d.name for d in upgrader.find_skill_dirs(skills_dir)}
+
+    inotify = Inotify()
+    inotify.add_watch(skills_dir, ROOT_MASK)
+    inotify.add_watch(script_path.parent, SCRIPT_MASK)
+    for name in skill_names:
+        inotify.add_watch(skills_dir / name, SKILL_MASK)
+
+    print(f"👀 Watching {len(skill_names)} skills in {skills_dir} (Ctrl+C to stop)\n")
+
+    pending: Set[str] = set()
+    categories_dirty = False
+    deadline: Optional[float] = None
+
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([inotify.fd], [], [], timeout)
+
+            if readable:
+                for path, mask, name in inotify.read_events():
+                    if mask & IN_Q_OVERFLOW:
+                        pending |= {d.name for d in upgrader.find_skill_dirs(skills_dir)}
+                    elif path == skills_dir:
+                        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                            new_dir = skills_dir / name
+                            if new_dir in upgrader.find_skill_dirs(skills_dir):
+                                try:
+                                    inotify.add_watch(new_dir, SKILL_MASK)
+                                except OSError:   # removed again before we got to it
+                                    continue
+                                skill_names.add(name)
+                                pending.add(name)
+                        elif mask & IN_ISDIR:
+                            skill_names.discard(name)
+                            pending.discard(name)
+                    elif path is not None and path.resolve() == script_path.parent:
+                        if name == script_path.name:
+                            categories_dirty = True
+                    elif path is not None and name == 'SKILL.md':
+                        pending.add(path.name)
+                deadline = time.monotonic() + debounce
+                continue
+
+            # Quiet for `debounce` seconds: flush the batch
+            deadline = None
+            if categories_dirty:
+                categories_dirty = False
+                new_categories = load_skill_categories(script_path)
+                if new_categories is None:
+                    print("  ⚠️  Could not parse SKILL_CATEGORIES, keeping previous mapping")
+                else:
+                    changed = changed_category_entries(upgrader.SKILL_CATEGORIES, new_categories)
+                    upgrader.SKILL_CATEGORIES.clear()
+                    upgrader.SKILL_CATEGORIES.update(new_categories)
+                    if changed:
+                        print(f"🔁 SKILL_CATEGORIES changed for: {', '.join(sorted(changed))}")
+                    pending |= changed & skill_names
+
+            batch = sorted(name for name in pending if (skills_dir / name).is_dir())
+            pending.clear()
+            if not batch:
+                continue
+
+            print(f"🔄 {time.strftime('%H:%M:%S')} Upgrading {len(batch)} changed skill(s)")
+            try:
+                counts = upgrader.upgrade_skills([skills_dir / name for name in batch],
+                                                 dry_run, jobs, manifest,
+                                                 batch_size=batch_size, atomic=atomic)
+                if manifest_path is not None and not dry_run:
+                    upgrader.save_manifest(manifest_path, manifest)
+            except Exception:
+                # One bad batch (unreadable file, full disk, broken worker) must
+                # not end the watch; the next edit to these skills retries them
+                print(f"   ❌ Batch failed, still watching:\n{traceback.format_exc()}", file=sys.stderr)
+                continue
+            print(f"   {counts[upgrader.REWRITTEN]} rewritten, {counts[upgrader.UNCHANGED]} unchanged, "
+                  f"{counts[upgrader.SKIPPED]} skipped\n")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        inotify.close()
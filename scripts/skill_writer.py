@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Transactional SKILL.md Writer
+
+Bulk rewrites are staged in a temp directory on the same filesystem as the
+skills, synced to disk once per batch and committed with atomic renames, so
+a killed run never leaves a truncated SKILL.md behind.
+
+Layout of a staging directory (<skills>/.skills-staging-XXXX/):
+
+    lock          held (flock) by the owning process for the batch's lifetime
+    files/        new contents, one file per target
+    backups/      hard links to the originals, taken just before commit
+    journal.json  written once staging is durable; marks a commit in progress
+
+If a run dies mid-commit, recover_interrupted_batches() restores the
+originals from the backups, so a batch is either fully applied or not at all.
+Batches whose lock is still held belong to a live run and are left alone;
+the OS releases the lock when the owner dies, however it dies.
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import shutil
+import socket
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import skill_profiler
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+STAGING_PREFIX = '.skills-staging-'
+JOURNAL_NAME = 'journal.json'
+LOCK_NAME = 'lock'
+
+# A staging directory without a lock file is either left by an older version
+# or being created right now; only the former is recovered
+LOCK_GRACE_SECONDS = 60
+
+
+def _try_lock(fd: int) -> bool:
+    """Take an exclusive, non-blocking lock on `fd`; False if someone holds it."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _libc_syncfs():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        return libc.syncfs
+    except (OSError, AttributeError, TypeError):
+        return None
+
+
+_SYNCFS = _libc_syncfs()
+
+
+def sync_filesystem(path: Path, files: List[Path] = ()) -> None:
+    """Flush the filesystem holding `path` to disk with a single call.
+
+    Uses syncfs(2) on Linux and sync(2) elsewhere; falls back to fsyncing
+    `files` one by one where neither is available.
+    """
+    if _SYNCFS is not None:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if _SYNCFS(fd) == 0:
+                return
+        finally:
+            os.close(fd)
+    if hasattr(os, 'sync'):
+        os.sync()
+        return
+    for file_path in files:
+        with open(file_path, 'rb+') as f:
+            os.fsync(f.fileno())
+
+
+def fsync_directory(path: Path) -> None:
+    """Make renames and unlinks inside `path` durable (no-op where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # e.g. Windows cannot fsync a directory
+    finally:
+        os.close(fd)
+
+
+def staged_name(target: Path) -> str:
+    """Stable per-target file name inside a staging directory."""
+    return hashlib.sha1(str(Path(target).resolve()).encode('utf-8')).hexdigest()
+
+
+def stage_file(staging_dir: Path, target: Path, content: bytes) -> Path:
+    """Write `content` for `target` into `staging_dir` (safe to call from workers)."""
+    staged = Path(staging_dir) / 'files' / staged_name(target)
+    staged.write_bytes(content)
+    return staged
+
+
+class SkillWriteBatch:
+    """Stage file rewrites and commit them together with atomic renames.
+
+    Use as a context manager: the batch is committed on a clean exit and
+    rolled back if the block raises.
+
+        with SkillWriteBatch(skills_dir) as batch:
+            batch.stage(skill_file, new_bytes)
+
+    Rewritten files keep the permission bits (and, where allowed, the owner)
+    of the files they replace.
+
+    Durability is not free: the extra staging write, the backup links and
+    the filesystem syncs make a batch several times slower than plain
+    in-place writes: 3.5x to 9x at 300 files, depending on how expensive a
+    sync is on the disk (see `benchmark_scripts.py --phases write`). For small trees that
+    is a few milliseconds; use in-place writes only where a torn file is
+    acceptable.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.staging_dir = Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=self.root))
+        self._lock_fd = os.open(self.staging_dir / LOCK_NAME, os.O_RDWR | os.O_CREAT, 0o644)
+        _try_lock(self._lock_fd)
+        os.write(self._lock_fd, f'{os.getpid()} {socket.gethostname()}\n'.encode('utf-8'))
+        (self.staging_dir / 'files').mkdir()
+        (self.staging_dir / 'backups').mkdir()
+        self.targets: List[Path] = []
+        self._journal: Optional[List[Tuple[str, str, Optional[str]]]] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def stage(self, target: Path, content: bytes) -> None:
+        stage_file(self.staging_dir, target, content)
+        self.add(target)
+
+    def add(self, target: Path) -> None:
+        """Register a target whose content was staged with stage_file()."""
+        target = Path(target)
+        if target not in self.targets:
+            self.targets.append(target)
+
+    def commit(self) -> List[Path]:
+        """Apply all staged writes; roll back and re-raise on failure."""
+        if not self.targets:
+            self._cleanup()
+            return []
+
+        with skill_profiler.phase('commit', f'{len(self.targets)} files', category='batch'):
+            return self._commit()
+
+    def _commit(self) -> List[Path]:
+        journal = []
+        for target in self.targets:
+            name = staged_name(target)
+            staged = self.staging_dir / 'files' / name
+            backup = None
+            if target.exists():
+                _copy_ownership(target, staged)
+                backup = self.staging_dir / 'backups' / name
+                try:
+                    os.link(target, backup)
+                except OSError:
+                    shutil.copy2(target, backup)
+            journal.append((str(target), str(staged), str(backup) if backup else None))
+
+        (self.staging_dir / JOURNAL_NAME).write_text(json.dumps(journal), encoding='utf-8')
+        sync_filesystem(self.staging_dir, [Path(s) for _, s, _ in journal])
+        self._journal = journal
+
+        try:
+            for target, staged, _ in journal:
+                os.replace(staged, target)
+        except BaseException:
+            self.rollback()
+            raise
+
+        sync_filesystem(self.root)
+        self._cleanup()
+        return list(self.targets)
+
+    def rollback(self) -> int:
+        """Undo any writes already applied and discard the staging directory."""
+        restored = _rollback_journal(self._journal) if self._journal else 0
+        self._cleanup()
+        return restored
+
+    def _cleanup(self) -> None:
+        # The journal must be gone for good before any backup is: a crash in
+        # the middle of rmtree() would otherwise leave a journal whose backups
+        # are missing, and recovery would delete the newly created targets.
+        try:
+            os.unlink(self.staging_dir / JOURNAL_NAME)
+            fsync_directory(self.staging_dir)
+        except FileNotFoundError:
+            pass
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)   # before rmtree: Windows cannot delete an open file
+            self._lock_fd = None
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        self._journal = None
+
+
+def _copy_ownership(source: Path, staged: Path) -> None:
+    """Give a staged file the mode and owner of the file it will replace."""
+    st = os.stat(source)
+    os.chmod(staged, stat.S_IMODE(st.st_mode))
+    if hasattr(os, 'chown'):
+        try:
+            os.chown(staged, st.st_uid, st.st_gid)
+        except OSError:
+            pass  # not root: the file keeps our ownership, as with any rewrite
+
+
+def _rollback_journal(journal: List[Tuple[str, str, Optional[str]]]) -> int:
+    restored = 0
+    for target, staged, backup in journal:
+        if os.path.exists(staged):
+            continue  # never renamed into place
+        if backup and os.path.exists(backup):
+            os.replace(backup, target)
+        elif not backup and os.path.exists(target):
+            os.unlink(target)
+        restored += 1
+    return restored
+
+
+def _claim_abandoned(staging_dir: Path) -> Tuple[bool, Optional[int]]:
+    """Lock a staging directory for recovery.
+
+    Returns (abandoned, lock_fd): abandoned is False while the owning batch
+    is alive (its lock is held) or may still be initialising.
+    """
+    try:
+        fd = os.open(staging_dir / LOCK_NAME, os.O_RDWR)
+    except FileNotFoundError:
+        try:
+            age = time.time() - staging_dir.stat().st_mtime
+        except FileNotFoundError:
+            return False, None  # cleaned up by its owner meanwhile
+        return age > LOCK_GRACE_SECONDS, None
+    if _try_lock(fd):
+        return True, fd
+    os.close(fd)
+    return False, None
+
+
+def recover_interrupted_batches(root: Path) -> int:
+    """Roll back batches left behind by a killed run. Returns files restored.
+
+    Batches still owned by a running process (in this or any other run)
+    are skipped.
+    """
+    restored = 0
+    for staging_dir in Path(root).glob(STAGING_PREFIX + '*'):
+        abandoned, lock_fd = _claim_abandoned(staging_dir)
+        if not abandoned:
+            continue
+        try:
+            journal_path = staging_dir / JOURNAL_NAME
+            if journal_path.exists():
+                try:
+                    journal = json.loads(journal_path.read_text(encoding='utf-8'))
+                except ValueError:
+                    journal = []  # journal not durable yet, so nothing was renamed
+                restored += _rollback_journal(journal)
+        finally:
+            if lock_fd is not None:
+                os.close(lock_fd)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    if restored:
+        sync_filesystem(Path(root))
+    return restored
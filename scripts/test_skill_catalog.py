@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Regression tests for skill_catalog.py
+
+Usage:
+    python3 -m pytest test_skill_catalog.py
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from skill_catalog import CATALOG_NAME, SkillCatalog
+
+
+def write_skill(skills_dir: Path, name: str, frontmatter: str) -> None:
+    skill_dir = skills_dir / name
+    skill_dir.mkdir()
+    (skill_dir / 'SKILL.md').write_text(f'---\n{frontmatter}---\n\n# {name}\n', encoding='utf-8')
+
+
+class NestedValuesTest(unittest.TestCase):
+    """A nested value where the catalog expects a scalar must not stop the build."""
+
+    def test_map_valued_description(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            skills_dir = Path(tmp)
+            write_skill(skills_dir, 'odd-skill',
+                        'name: odd-skill\n'
+                        'description:\n  en: Fill templates\n  zh: 填充模板\n'
+                        'author: {name: someone}\n'
+                        'category: {main: finance}\n'
+                        'mcp:\n  server: {host: local}\n  tools: [fill_template]\n')
+            write_skill(skills_dir, 'plain-skill',
+                        'name: plain-skill\ndescription: "Plain"\ncategory: legal\n')
+
+            with SkillCatalog(skills_dir / CATALOG_NAME) as catalog:
+                counts = catalog.build(skills_dir)
+                odd = catalog.get('odd-skill')
+                plain = catalog.get('plain-skill')
+
+        self.assertEqual(counts['added'], 2)
+        self.assertEqual(odd['description'], 'A skill for odd skill')
+        self.assertEqual(odd['author'], 'claude-office-skills')
+        self.assertEqual(odd['category'], 'productivity')
+        self.assertEqual(odd['mcp_server'], 'office-mcp')
+        self.assertEqual(plain['description'], 'Plain')
+        self.assertEqual(plain['category'], 'legal')
+
+
+if __name__ == '__main__':
+    unittest.main()
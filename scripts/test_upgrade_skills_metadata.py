@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Regression tests for upgrade_skills_metadata.py
+
+Usage:
+    python3 -m pytest test_upgrade_skills_metadata.py
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import upgrade_skills_metadata as upgrader
+
+
+NESTED_FRONTMATTER = """---
+name: nested-skill
+description:
+  en: Fill templates
+  zh: 填充模板
+author: {name: someone, url: example.com}
+version: [1, 2]
+license: MIT
+---
+
+# Nested Skill
+"""
+
+
+class NonScalarBasicFieldsTest(unittest.TestCase):
+    """Nested maps and lists in basic fields must never reach the output as a repr."""
+
+    def test_resolve_falls_back_to_defaults(self):
+        existing, _ = upgrader.split_frontmatter(NESTED_FRONTMATTER)
+        self.assertIsInstance(existing['description'], dict)
+
+        fields = upgrader.resolve_skill_fields('nested-skill', existing, {})
+        self.assertEqual(fields['description'], 'A skill for nested skill')
+        self.assertEqual(fields['author'], 'claude-office-skills')
+        self.assertEqual(fields['version'], '1.0.0')
+        self.assertEqual(fields['license'], 'MIT')
+
+    def test_upgraded_file_has_no_python_repr(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_dir = Path(tmp) / 'nested-skill'
+            skill_dir.mkdir()
+            (skill_dir / 'SKILL.md').write_text(NESTED_FRONTMATTER, encoding='utf-8')
+
+            status, _ = upgrader.upgrade_skill(skill_dir)
+            content = (skill_dir / 'SKILL.md').read_text(encoding='utf-8')
+
+        self.assertEqual(status, upgrader.REWRITTEN)
+        self.assertIn('description: "A skill for nested skill"\n', content)
+        self.assertIn('author: claude-office-skills\n', content)
+        for fragment in ("{'", "['", '{name'):
+            self.assertNotIn(fragment, content)
+
+    def test_string_fields_are_kept(self):
+        existing, _ = upgrader.split_frontmatter(
+            '---\nname: plain\ndescription: "Plain text"\nversion: "2.0"\n---\n')
+        fields = upgrader.resolve_skill_fields('plain', existing, {})
+        self.assertEqual(fields['description'], 'Plain text')
+        self.assertEqual(fields['version'], '2.0')
+
+
+if __name__ == '__main__':
+    unittest.main()
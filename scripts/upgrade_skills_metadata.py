@@ -6,15 +6,28 @@ This script upgrades existing SKILL.md files to the enhanced v2.0 metadata forma
 It adds MCP tool references, categories, tags, and other enhanced metadata.
 
 Usage:
-    python3 upgrade_skills_metadata.py [--dry-run] [--skill SKILL_NAME]
+    python3 upgrade_skills_metadata.py [--dry-run] [--skill SKILL_NAME] [--jobs N]
+                                       [--incremental] [--manifest PATH]
+                                       [--watch [--debounce SECONDS]]
+                                       [--batch-size N] [--in-place] [--skills-dir PATH]
+                                       [--profile [TRACE_FILE]]
 """
 
+import hashlib
+import io
+import json
 import os
 import re
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import skill_profiler
+from skill_writer import SkillWriteBatch, recover_interrupted_batches, stage_file
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SKILL CATEGORY MAPPING
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -467,164 +480,591 @@ SKILL_CATEGORIES = {
     },
 }
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# INCREMENTAL MANIFEST
+# ═══════════════════════════════════════════════════════════════════════════════
+
+MANIFEST_NAME = '.skills-manifest.json'
+
+# Bump whenever generate_enhanced_frontmatter() output changes, so that every
+# skill recorded by an older manifest is re-rendered on the next run.
+MANIFEST_VERSION = 1
+
+# Skills per transactional write batch (one filesystem sync per batch)
+DEFAULT_BATCH_SIZE = 1000
+
+# Statuses returned by upgrade_skill()
+REWRITTEN = 'rewritten'
+UNCHANGED = 'unchanged'
+SKIPPED = 'skipped'
+MISSING = 'missing'
+
+
+def metadata_hash(skill_name: str) -> str:
+    """Hash the SKILL_CATEGORIES entry of a skill ({} for unmapped skills)."""
+    entry = SKILL_CATEGORIES.get(skill_name, {})
+    return hashlib.sha256(json.dumps(entry, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def load_manifest(manifest_path: Path) -> Dict[str, dict]:
+    """Load per-skill manifest entries, or {} if missing, corrupt or outdated."""
+    try:
+        data = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+        return {}
+    return data.get('skills', {})
+
+
+def save_manifest(manifest_path: Path, entries: Dict[str, dict]) -> None:
+    """Write the manifest via a temp file so a killed run never truncates it."""
+    data = {'version': MANIFEST_VERSION, 'skills': dict(sorted(entries.items()))}
+    tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    tmp_path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+    os.replace(tmp_path, manifest_path)
+
+
+def _manifest_entry(skill_file: Path, source_hash: str, meta_hash: str) -> dict:
+    stat = skill_file.stat()
+    return {
+        'source': source_hash,
+        'metadata': meta_hash,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+FRONTMATTER_DELIMITER = '---'
+BLOCK_SCALAR_STYLES = ('|', '|-', '|+', '>', '>-', '>+')
+
+
+def _strip_comment(value: str) -> str:
+    """Drop a trailing ` # comment` from an unquoted YAML value."""
+    value = value.strip()
+    if value.startswith(('"', "'")):
+        return value
+    if value.startswith('#'):
+        return ''
+    return value.split(' #', 1)[0].rstrip()
+
+
+def _split_flow(inner: str) -> List[str]:
+    """Split the inside of a flow collection on top-level commas.
+
+    Commas inside quotes or nested `[...]` / `{...}` do not split.
+    """
+    items, current, depth, quote = [], [], 0, None
+    for char in inner:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char in '[{':
+            depth += 1
+        elif char in ']}':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            items.append(''.join(current))
+            current = []
+            continue
+        current.append(char)
+    items.append(''.join(current))
+    return [item.strip() for item in items if item.strip()]
+
+
+def _parse_scalar(value: str):
+    """Parse an inline YAML value: a flow list, a flow map or a (possibly quoted) string."""
+    value = _strip_comment(value)
+    if value.startswith('[') and value.endswith(']'):
+        return [_parse_scalar(item) for item in _split_flow(value[1:-1])]
+    if value.startswith('{') and value.endswith('}'):
+        mapping = {}
+        for item in _split_flow(value[1:-1]):
+            key, _, item_value = item.partition(':')
+            mapping[key.strip().strip('"').strip("'")] = _parse_scalar(item_value)
+        return mapping
+    return value.strip('"').strip("'")
+
+
+def parse_frontmatter_lines(lines: List[str]) -> dict:
+    """Parse the YAML subset used by SKILL.md frontmatter.
+
+    Supports scalars, flow lists (`[a, b]`) and flow maps (`{k: v}`), nested
+    maps, block lists (indented or not, including lists of maps) and block
+    scalars (`|` / `>`). Comments and blank lines are ignored. Scalar values
+    are kept as strings.
+    """
+    root: dict = {}
+    stack: List[Tuple[int, object]] = [(0, root)]   # (indent, container)
+    pending: Optional[Tuple[int, dict, str]] = None  # key waiting for a nested block
+    block: Optional[Tuple[int, dict, str, str, List[str]]] = None  # open `|` / `>` scalar
+
+    def close_block() -> None:
+        _, target, key, style, raw_lines = block
+        margin = min((len(l) - len(l.lstrip()) for l in raw_lines if l.strip()), default=0)
+        text = [l[margin:] if l.strip() else '' for l in raw_lines]
+        while text and not text[-1]:
+            text.pop()
+        joiner = '\n' if style.startswith('|') else ' '
+        keep_newline = text and not style.endswith('-')
+        target[key] = joiner.join(text) + ('\n' if keep_newline else '')
+
+    def add_pair(container: dict, text: str, indent: int) -> None:
+        nonlocal pending, block
+        key, sep, value = text.partition(':')
+        if not sep:
+            return
+        key = key.strip()
+        value = _strip_comment(value)
+        if value in BLOCK_SCALAR_STYLES:
+            block = (indent, container, key, value, [])
+            container[key] = ''
+        elif value:
+            container[key] = _parse_scalar(value)
+        else:
+            container[key] = ''
+            pending = (indent, container, key)
+
+    for raw in lines:
+        raw = raw.rstrip('\r\n')
+        stripped = raw.strip()
+        indent = len(raw) - len(raw.lstrip(' \t'))
+
+        if block is not None:
+            if not stripped or indent > block[0]:
+                block[4].append(raw)
+                continue
+            close_block()
+            block = None
+
+        if not stripped or stripped.startswith('#'):
+            continue
+
+        if pending is not None:
+            pending_indent, parent, key = pending
+            pending = None
+            if indent > pending_indent or (indent == pending_indent and stripped.startswith('-')):
+                child = [] if stripped.startswith('-') else {}
+                parent[key] = child
+                stack.append((indent, child))
+
+        while len(stack) > 1 and stack[-1][0] > indent:
+            stack.pop()
+        # A key at the indent of an unindented block list (`tags:` / `- a` /
+        # `version: 2`) ends the list: continue in the enclosing map.
+        while (len(stack) > 1 and isinstance(stack[-1][1], list)
+               and stack[-1][0] == indent and not stripped.startswith('-')):
+            stack.pop()
+        container = stack[-1][1]
+
+        if isinstance(container, list):
+            if not stripped.startswith('-'):
+                continue
+            item = stripped[1:].strip()
+            key, sep, _ = item.partition(':')
+            if sep and key and ' ' not in key.strip() and not item.startswith(('"', "'", '[')):
+                mapping: dict = {}
+                container.append(mapping)
+                item_indent = indent + (len(stripped) - len(item))
+                stack.append((item_indent, mapping))
+                add_pair(mapping, item, item_indent)
+            elif item:
+                container.append(_parse_scalar(item))
+        else:
+            add_pair(container, stripped, indent)
+
+    if block is not None:
+        close_block()
+
+    return root
+
+
+def read_frontmatter(file_path: Path) -> Tuple[dict, int]:
+    """Read only the frontmatter of a SKILL.md file.
+
+    Streams the file line by line and stops at the closing `---`, so the body
+    is never loaded. Returns (frontmatter, body_offset) where body_offset is
+    the byte offset of the first line after the frontmatter (0 if the file has
+    none); pass it to read_body() when the body is actually needed.
+
+    It is not faster than a regex over the whole file: on 9.5 KB skills it
+    runs at about 0.55x the speed of the original regex parser (see the parse
+    phase of benchmark_scripts.py). Use it for the structure it returns.
+    """
+    with open(file_path, 'rb') as f:
+        first = f.readline()
+        if first.rstrip() != FRONTMATTER_DELIMITER.encode():
+            return {}, 0
+
+        offset = len(first)
+        lines = []
+        for line in f:
+            offset += len(line)
+            if line.rstrip() == FRONTMATTER_DELIMITER.encode():
+                return parse_frontmatter_lines([l.decode('utf-8') for l in lines]), offset
+            lines.append(line)
+
+    # Unterminated frontmatter: treat the whole file as body
+    return {}, 0
+
+
+def read_body(file_path: Path, body_offset: int) -> str:
+    """Read the body of a SKILL.md file starting at `body_offset`."""
+    with open(file_path, 'rb') as f:
+        f.seek(body_offset)
+        return f.read().decode('utf-8')
+
+
+def split_frontmatter(content: str) -> Tuple[dict, str]:
+    """Split SKILL.md text that is already in memory into (frontmatter, body)."""
+    lines = content.splitlines(keepends=True)
+    if not lines or lines[0].rstrip() != FRONTMATTER_DELIMITER:
+        return {}, content
+
+    for i, line in enumerate(lines[1:], 1):
+        if line.rstrip() == FRONTMATTER_DELIMITER:
+            return parse_frontmatter_lines(lines[1:i]), ''.join(lines[i + 1:])
+
+    return {}, content
+
+
 def parse_skill_file(file_path: Path) -> Tuple[dict, str]:
     """Parse a SKILL.md file and extract frontmatter and content."""
-    content = file_path.read_text(encoding='utf-8')
-    
-    # Match YAML frontmatter
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
-    
-    if match:
-        frontmatter_str = match.group(1)
-        body = match.group(2)
-        # Simple YAML parsing
-        frontmatter = {}
-        for line in frontmatter_str.strip().split('\n'):
-            if ':' in line and not line.startswith(' ') and not line.startswith('\t'):
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                frontmatter[key] = value
-        return frontmatter, body
+    frontmatter, body_offset = read_frontmatter(file_path)
+    return frontmatter, read_body(file_path, body_offset)
+
+
+def resolve_skill_fields(skill_name: str, existing: dict, metadata: Optional[dict] = None) -> dict:
+    """Resolve the v2.0 field model of a skill.
+
+    Basic information comes from the `existing` frontmatter, categorization
+    from `metadata` (the skill's SKILL_CATEGORIES entry by default). Missing
+    values, and basic fields that are not plain strings, fall back to the
+    defaults used for unmapped skills.
+    """
+    if metadata is None:
+        metadata = SKILL_CATEGORIES.get(skill_name, {})
     
-    return {}, content
+    def basic(key: str, default: str) -> str:
+        # Rendered into a one-line scalar: a nested map or list falls back to the default
+        value = existing.get(key, default)
+        return value if isinstance(value, str) else default
+    
+    return {
+        'name': basic('name', skill_name),
+        'description': basic('description', f'A skill for {skill_name.replace("-", " ")}'),
+        'version': basic('version', '1.0.0'),
+        'author': basic('author', 'claude-office-skills'),
+        'license': basic('license', 'MIT'),
+        'category': metadata.get('category', 'productivity'),
+        'tags': metadata.get('tags', [skill_name.replace('-', ' ')]),
+        'department': metadata.get('department', 'All'),
+        'mcp_tools': metadata.get('mcp_tools', []),
+        'capabilities': metadata.get('capabilities', []),
+    }
+
+
+# Static parts of the v2.0 frontmatter, compiled once at import time
+FRONTMATTER_HEADER = (
+    '---\n'
+    '# ═══════════════════════════════════════════════════════════════════════════════\n'
+    '# CLAUDE OFFICE SKILL - Enhanced Metadata v2.0\n'
+    '# ═══════════════════════════════════════════════════════════════════════════════\n'
+    '\n'
+    '# Basic Information\n'
+)
+
+MODELS_BLOCK = (
+    '\n'
+    '# AI Model Compatibility\n'
+    'models:\n'
+    '  recommended:\n'
+    '    - claude-sonnet-4\n'
+    '    - claude-opus-4\n'
+    '  compatible:\n'
+    '    - claude-3-5-sonnet\n'
+    '    - gpt-4\n'
+    '    - gpt-4o'
+)
+
+MCP_BLOCK_HEADER = (
+    '\n'
+    '\n'
+    '# MCP Tools Integration\n'
+    'mcp:\n'
+    '  server: office-mcp\n'
+    '  tools:'
+)
+
+CAPABILITIES_BLOCK_HEADER = (
+    '\n'
+    '\n'
+    '# Skill Capabilities\n'
+    'capabilities:'
+)
+
+LANGUAGES_BLOCK = (
+    '\n'
+    '\n'
+    '# Language Support\n'
+    'languages:\n'
+    '  - en\n'
+    '  - zh\n'
+    '---'
+)
+
+
+@lru_cache(maxsize=4096)
+def render_categorization(category: str, tags: tuple, department: str,
+                          mcp_tools: tuple, capabilities: tuple) -> str:
+    """Render everything after the basic information block.
+
+    Skills sharing a SKILL_CATEGORIES entry share this fragment, so it is
+    memoized on the field values; arguments must be hashable (tuples).
+    """
+    parts = ['\n# Categorization\ncategory: ', str(category), '\ntags:']
+    parts.extend(f'\n  - {tag}' for tag in tags)
+    parts.append(f'\ndepartment: {department}\n')
+    parts.append(MODELS_BLOCK)
+    if mcp_tools:
+        parts.append(MCP_BLOCK_HEADER)
+        parts.extend(f'\n    - {tool}' for tool in mcp_tools)
+    if capabilities:
+        parts.append(CAPABILITIES_BLOCK_HEADER)
+        parts.extend(f'\n  - {cap}' for cap in capabilities)
+    parts.append(LANGUAGES_BLOCK)
+    return ''.join(parts)
 
 
 def generate_enhanced_frontmatter(skill_name: str, existing: dict) -> str:
     """Generate enhanced frontmatter for a skill as a string."""
-    metadata = SKILL_CATEGORIES.get(skill_name, {})
-    
-    # Get values
-    name = existing.get('name', skill_name)
-    description = existing.get('description', f'A skill for {skill_name.replace("-", " ")}')
-    version = existing.get('version', '1.0.0')
-    author = existing.get('author', 'claude-office-skills')
-    license_val = existing.get('license', 'MIT')
-    
-    category = metadata.get('category', 'productivity')
-    tags = metadata.get('tags', [skill_name.replace('-', ' ')])
-    department = metadata.get('department', 'All')
-    mcp_tools = metadata.get('mcp_tools', [])
-    capabilities = metadata.get('capabilities', [])
-    
-    # Build frontmatter string
-    lines = [
-        '---',
-        '# ═══════════════════════════════════════════════════════════════════════════════',
-        '# CLAUDE OFFICE SKILL - Enhanced Metadata v2.0',
-        '# ═══════════════════════════════════════════════════════════════════════════════',
-        '',
-        '# Basic Information',
-        f'name: {name}',
-        f'description: "{description}"',
-        f'version: "{version}"',
-        f'author: {author}',
-        f'license: {license_val}',
-        '',
-        '# Categorization',
-        f'category: {category}',
-        'tags:',
-    ]
+    fields = resolve_skill_fields(skill_name, existing)
     
-    for tag in tags:
-        lines.append(f'  - {tag}')
-    
-    lines.extend([
-        f'department: {department}',
-        '',
-        '# AI Model Compatibility',
-        'models:',
-        '  recommended:',
-        '    - claude-sonnet-4',
-        '    - claude-opus-4',
-        '  compatible:',
-        '    - claude-3-5-sonnet',
-        '    - gpt-4',
-        '    - gpt-4o',
-    ])
-    
-    # Add MCP tools if available
-    if mcp_tools:
-        lines.extend([
-            '',
-            '# MCP Tools Integration',
-            'mcp:',
-            '  server: office-mcp',
-            '  tools:',
-        ])
-        for tool in mcp_tools:
-            lines.append(f'    - {tool}')
-    
-    # Add capabilities if available
-    if capabilities:
-        lines.extend([
-            '',
-            '# Skill Capabilities',
-            'capabilities:',
-        ])
-        for cap in capabilities:
-            lines.append(f'  - {cap}')
-    
-    lines.extend([
-        '',
-        '# Language Support',
-        'languages:',
-        '  - en',
-        '  - zh',
-        '---',
-    ])
-    
-    return '\n'.join(lines)
-
-
-def upgrade_skill(skill_path: Path, dry_run: bool = False) -> bool:
-    """Upgrade a single skill file."""
+    basic = (
+        f"name: {fields['name']}\n"
+        f"description: \"{fields['description']}\"\n"
+        f"version: \"{fields['version']}\"\n"
+        f"author: {fields['author']}\n"
+        f"license: {fields['license']}\n"
+    )
+    categorization = render_categorization(
+        fields['category'],
+        tuple(fields['tags']),
+        fields['department'],
+        tuple(fields['mcp_tools']),
+        tuple(fields['capabilities']),
+    )
+    
+    return FRONTMATTER_HEADER + basic + categorization
+
+
+def upgrade_skill(skill_path: Path, dry_run: bool = False,
+                  previous: Optional[dict] = None,
+                  staging_dir: Optional[Path] = None) -> Tuple[str, Optional[dict]]:
+    """Upgrade a single skill file.
+
+    `previous` is the skill's entry from the last run's manifest. When both the
+    SKILL.md bytes and the SKILL_CATEGORIES entry still match it, the skill is
+    skipped without being parsed. The file is only written when the rendered
+    bytes differ; with `staging_dir` the new bytes are staged there for a
+    SkillWriteBatch to commit instead of being written in place.
+    Returns (status, manifest_entry); the entry is None for dry runs and
+    missing files, and has no mtime yet for staged writes.
+    """
     skill_file = skill_path / 'SKILL.md'
     
     if not skill_file.exists():
         print(f"  ⚠️  No SKILL.md found in {skill_path.name}")
-        return False
+        return MISSING, None
     
     skill_name = skill_path.name
-    existing_fm, body = parse_skill_file(skill_file)
+    meta_hash = metadata_hash(skill_name)
     
-    # Generate enhanced frontmatter
-    new_frontmatter = generate_enhanced_frontmatter(skill_name, existing_fm)
+    with skill_profiler.phase('read', skill_name):
+        # Cheap stat check first, then fall back to hashing the bytes
+        if previous and previous.get('metadata') == meta_hash:
+            stat = skill_file.stat()
+            if stat.st_size == previous.get('size') and stat.st_mtime_ns == previous.get('mtime_ns'):
+                return SKIPPED, previous
+        
+        raw = skill_file.read_bytes()
+        source_hash = hashlib.sha256(raw).hexdigest()
     
-    # Format new content
-    new_content = f"{new_frontmatter}\n\n{body.lstrip()}"
+    if previous and previous.get('metadata') == meta_hash and previous.get('source') == source_hash:
+        return SKIPPED, _manifest_entry(skill_file, source_hash, meta_hash)
     
-    if dry_run:
+    with skill_profiler.phase('parse', skill_name):
+        existing_fm, body = split_frontmatter(raw.decode('utf-8'))
+    
+    with skill_profiler.phase('render', skill_name):
+        # Generate enhanced frontmatter
+        new_frontmatter = generate_enhanced_frontmatter(skill_name, existing_fm)
+        
+        # Format new content
+        new_content = f"{new_frontmatter}\n\n{body.lstrip()}".encode('utf-8')
+    
+    if new_content == raw:
+        print(f"  ➖ Up to date: {skill_name}")
+        status = UNCHANGED
+    elif dry_run:
         metadata = SKILL_CATEGORIES.get(skill_name, {})
         print(f"  📝 Would upgrade: {skill_name}")
         print(f"     Category: {metadata.get('category', 'productivity')}")
         print(f"     Tags: {metadata.get('tags', [])}")
         print(f"     MCP Tools: {metadata.get('mcp_tools', [])}")
+        status = REWRITTEN
+    elif staging_dir is not None:
+        with skill_profiler.phase('write', skill_name):
+            stage_file(staging_dir, skill_file, new_content)
+        print(f"  ✅ Upgraded: {skill_name}")
+        status = REWRITTEN
+        return status, {
+            'source': hashlib.sha256(new_content).hexdigest(),
+            'metadata': meta_hash,
+            'size': len(new_content),
+            'mtime_ns': None,
+        }
     else:
-        skill_file.write_text(new_content, encoding='utf-8')
+        with skill_profiler.phase('write', skill_name):
+            skill_file.write_bytes(new_content)
+        source_hash = hashlib.sha256(new_content).hexdigest()
         print(f"  ✅ Upgraded: {skill_name}")
+        status = REWRITTEN
     
-    return True
+    if dry_run:
+        return status, None
+    return status, _manifest_entry(skill_file, source_hash, meta_hash)
+
+
+def _upgrade_skill_captured(task: Tuple[Path, bool, Optional[dict], Optional[Path]],
+                            profile: bool = False) -> Tuple[str, Optional[dict], str, List[dict]]:
+    """Run upgrade_skill() in a worker and return its result with captured output.
+
+    With `profile`, the worker's trace events are returned for the parent to merge.
+    """
+    if profile:
+        skill_profiler.enable()
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        status, entry = upgrade_skill(*task)
+    events = skill_profiler.active().drain() if profile else []
+    return status, entry, buffer.getvalue(), events
+
+
+def upgrade_skills(skill_dirs: List[Path], dry_run: bool = False, jobs: int = 1,
+                   manifest: Optional[Dict[str, dict]] = None,
+                   batch_size: int = DEFAULT_BATCH_SIZE, atomic: bool = True) -> Dict[str, int]:
+    """Upgrade skills in sorted order, optionally spread over a process pool.
+
+    Worker output is buffered per skill and printed in input order, so the log
+    is identical to a serial run. If `manifest` is given it is consulted to
+    skip unchanged skills and updated in place with the new entries.
+
+    With `atomic` (the default) rewrites are staged and committed through a
+    SkillWriteBatch every `batch_size` skills: one filesystem sync and a
+    series of atomic renames per batch, rolled back if the batch fails.
+    That safety makes writing several times slower than `atomic=False`
+    (see SkillWriteBatch). Returns a count per status.
+    """
+    skill_dirs = sorted(skill_dirs)
+    counts = {REWRITTEN: 0, UNCHANGED: 0, SKIPPED: 0, MISSING: 0}
+    previous = manifest if manifest is not None else {}
+    use_batches = atomic and not dry_run and bool(skill_dirs)
+    batch_size = batch_size if use_batches else max(1, len(skill_dirs))
+
+    profiler = skill_profiler.active()
+    worker = partial(_upgrade_skill_captured, profile=profiler is not None)
+    executor = None
+    if jobs > 1 and len(skill_dirs) > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+
+    try:
+        for start in range(0, len(skill_dirs), batch_size):
+            chunk = skill_dirs[start:start + batch_size]
+            batch = SkillWriteBatch(chunk[0].parent) if use_batches else None
+            staging_dir = batch.staging_dir if batch is not None else None
+            tasks = [(d, dry_run, previous.get(d.name), staging_dir) for d in chunk]
+
+            if executor is None:
+                results = (upgrade_skill(*task) + ('', []) for task in tasks)
+            else:
+                chunksize = max(1, len(tasks) // (jobs * 8))
+                results = executor.map(worker, tasks, chunksize=chunksize)
+
+            entries = {}
+            with batch if batch is not None else nullcontext():
+                for task, (status, entry, output, events) in zip(tasks, results):
+                    print(output, end='')
+                    if events:
+                        profiler.extend(events)
+                    counts[status] += 1
+                    if entry is not None:
+                        entries[task[0].name] = entry
+                    if status == REWRITTEN and batch is not None:
+                        batch.add(task[0] / 'SKILL.md')
+
+            if manifest is not None:
+                for name, entry in entries.items():
+                    if entry['mtime_ns'] is None:
+                        entry = _manifest_entry(chunk[0].parent / name / 'SKILL.md',
+                                                entry['source'], entry['metadata'])
+                    manifest[name] = entry
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return counts
+
+
+def find_skill_dirs(skills_dir: Path) -> List[Path]:
+    """List all skill directories under `skills_dir` (special folders excluded)."""
+    exclude = {'_template', 'scripts', 'official-skills', 'mcp-servers', '.git'}
+    return [
+        d for d in skills_dir.iterdir()
+        if d.is_dir() and d.name not in exclude and not d.name.startswith('.')
+    ]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # MAIN FUNCTION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description='Upgrade Skills metadata to v2.0')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without writing')
     parser.add_argument('--skill', type=str, help='Upgrade a specific skill only')
-    args = parser.parse_args()
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of worker processes (0 = one per CPU)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Skip skills unchanged since the last run (uses the manifest)')
+    parser.add_argument('--manifest', type=Path,
+                        help=f'Manifest path for --incremental (default: <skills>/{MANIFEST_NAME})')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and re-upgrade skills as they change (Linux inotify)')
+    parser.add_argument('--debounce', type=float, default=0.5,
+                        help='Seconds of quiet before a burst of edits is processed (--watch)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='Skills per atomic write batch')
+    parser.add_argument('--in-place', action='store_true',
+                        help='Write each SKILL.md directly instead of staged atomic batches '
+                             '(several times faster, but a killed run can leave a torn file)')
+    parser.add_argument('--profile', type=Path, nargs='?', const=Path('upgrade_profile.trace.json'),
+                        metavar='TRACE_FILE',
+                        help='Record per-skill phase timings to a Chrome trace file '
+                             '(default: upgrade_profile.trace.json) and print percentiles')
+    parser.add_argument('--skills-dir', type=Path, default=Path(__file__).parent.parent,
+                        help='Root of the skills tree (default: the repository root)')
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
     
     # Get skills directory
-    script_dir = Path(__file__).parent
-    skills_dir = script_dir.parent
+    skills_dir = args.skills_dir
     
     print("═" * 60)
     print("  Claude Office Skills - Metadata Upgrade Script v2.1")
@@ -633,6 +1073,10 @@ def main():
     
     if args.dry_run:
         print("🔍 DRY RUN MODE - No files will be modified\n")
+    else:
+        restored = recover_interrupted_batches(skills_dir)
+        if restored:
+            print(f"↩️  Rolled back {restored} file(s) from an interrupted run\n")
     
     # Get list of skills to upgrade
     if args.skill:
@@ -642,28 +1086,51 @@ def main():
             return
     else:
         # Get all skill directories (exclude special folders)
-        exclude = {'_template', 'scripts', 'official-skills', 'mcp-servers', '.git'}
-        skill_dirs = [
-            d for d in skills_dir.iterdir()
-            if d.is_dir() and d.name not in exclude and not d.name.startswith('.')
-        ]
+        skill_dirs = find_skill_dirs(skills_dir)
     
     print(f"📦 Found {len(skill_dirs)} skills to process\n")
     
+    manifest = None
+    manifest_path = args.manifest or skills_dir / MANIFEST_NAME
+    if args.incremental:
+        manifest = load_manifest(manifest_path)
+        print(f"🗂️  Incremental mode: {len(manifest)} skills in {manifest_path.name}\n")
+    elif args.watch:
+        manifest = {}  # in-memory only, lets the watcher skip its own writes
+    
+    if args.profile:
+        skill_profiler.enable()
+    
     # Process each skill
-    upgraded = 0
-    skipped = 0
+    counts = upgrade_skills(skill_dirs, args.dry_run, jobs, manifest,
+                            batch_size=args.batch_size, atomic=not args.in_place)
     
-    for skill_dir in sorted(skill_dirs):
-        if upgrade_skill(skill_dir, args.dry_run):
-            upgraded += 1
-        else:
-            skipped += 1
+    if args.incremental and not args.dry_run:
+        save_manifest(manifest_path, manifest)
     
     print()
     print("═" * 60)
-    print(f"  Summary: {upgraded} upgraded, {skipped} skipped")
+    print(f"  Summary: {counts[REWRITTEN]} rewritten, {counts[UNCHANGED]} unchanged, "
+          f"{counts[SKIPPED]} skipped, {counts[MISSING]} missing")
     print("═" * 60)
+    
+    if args.profile:
+        profiler = skill_profiler.active()
+        profiler.write_trace(args.profile)
+        print(f"\n⏱️  Phase timings (ms), trace written to {args.profile}\n")
+        profiler.print_summary()
+    
+    if args.watch:
+        import skill_watcher
+        print()
+        skill_watcher.watch_skills(
+            skills_dir, Path(__file__), args.dry_run, jobs,
+            manifest=manifest,
+            manifest_path=manifest_path if args.incremental else None,
+            debounce=args.debounce,
+            batch_size=args.batch_size,
+            atomic=not args.in_place,
+        )
 
 
 if __name__ == '__main__':